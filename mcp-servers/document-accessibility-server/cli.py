@@ -9,16 +9,36 @@ import asyncio
 import json
 import os
 import sys
+
+try:
+    import orjson
+except ImportError:  # optional speedup, fall back to stdlib json
+    orjson = None
+
 from docx_auditor import audit_docx_accessibility
+from docx_tools import check_docx_all
 from pdf_auditor import audit_pdf_accessibility
 
 # Configure output to be pure JSON
 def print_json(data):
-    print(json.dumps(data, indent=2))
+    if orjson is None:
+        print(json.dumps(data, indent=2))
+        return
+    
+    # Stringify any value or key orjson can't serialize natively rather than
+    # failing the whole report
+    sys.stdout.flush()
+    sys.stdout.buffer.write(orjson.dumps(
+        data,
+        default=str,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+    ))
+    sys.stdout.buffer.write(b"\n")
+    sys.stdout.buffer.flush()
 
 async def main():
     parser = argparse.ArgumentParser(description="Document Accessibility Auditor CLI")
-    parser.add_argument("command", choices=["audit_docx", "audit_pdf"], help="Command to run")
+    parser.add_argument("command", choices=["audit_docx", "audit_pdf", "check_docx_all"], help="Command to run")
     parser.add_argument("file_path", help="Path to the file to audit")
     parser.add_argument("--detailed", action="store_true", help="Run detailed audit")
     
@@ -36,6 +56,9 @@ async def main():
         elif args.command == "audit_pdf":
             result = await audit_pdf_accessibility(file_path, detailed=args.detailed)
             print_json(result)
+        elif args.command == "check_docx_all":
+            result = check_docx_all(file_path)
+            print_json(result)
             
     except Exception as e:
         print(json.dumps({"error": str(e), "file": file_path}))
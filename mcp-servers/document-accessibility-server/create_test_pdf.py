@@ -1,19 +1,29 @@
 from PIL import Image, ImageDraw, ImageFont
 import os
 
-def create_inaccessible_pdf():
-    """Create an inaccessible PDF (image-only, untagged)."""
-    # Create an image with text (simulating scanned doc)
-    img = Image.new('RGB', (600, 800), color = (255, 255, 255))
-    d = ImageDraw.Draw(img)
-    
-    # Add some text to the image
-    d.text((10,10), "This is an inaccessible PDF", fill=(0,0,0))
-    d.text((10,30), "It is just an image.", fill=(0,0,0))
-    
-    # Save as PDF
-    img.save('test_bad.pdf')
-    print("Created test_bad.pdf")
+# Loaded once and reused for every fixture
+_FONT = ImageFont.load_default()
+_CANVAS = Image.new('RGB', (600, 800), color = (255, 255, 255))
+_DRAW = ImageDraw.Draw(_CANVAS)
+
+def create_inaccessible_pdf(n=1, out_dir='.'):
+    """Create inaccessible PDFs (image-only, untagged).
+
+    A single fixture is written as test_bad.pdf; batches are numbered
+    test_bad_0.pdf, test_bad_1.pdf, ...
+    """
+    for i in range(n):
+        # Clear the shared canvas (simulating a scanned doc)
+        _DRAW.rectangle([0, 0, 600, 800], fill=(255, 255, 255))
+
+        # Add some text to the image
+        _DRAW.text((10,10), "This is an inaccessible PDF", fill=(0,0,0), font=_FONT)
+        _DRAW.text((10,30), "It is just an image.", fill=(0,0,0), font=_FONT)
+
+        # Save as PDF
+        filename = 'test_bad.pdf' if n == 1 else f'test_bad_{i}.pdf'
+        _CANVAS.save(os.path.join(out_dir, filename))
+        print(f"Created {filename}")
 
 if __name__ == "__main__":
     create_inaccessible_pdf()
@@ -4,19 +4,153 @@ DOCX Accessibility Auditor
 Comprehensive DOCX accessibility checking following WCAG 2.2 AA standards.
 """
 
+import asyncio
+import copy
 import logging
+import os
+import re
+import zipfile
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Callable, Dict, Iterator, List, Any, Optional, Tuple
 from docx import Document
+from docx.enum.style import WD_STYLE_TYPE
 from docx.oxml.ns import qn
+from docx.text.paragraph import Paragraph
 
 logger = logging.getLogger(__name__)
 
+# Link texts that don't describe their target (WCAG 2.4.4)
+_NON_DESCRIPTIVE_LINKS = frozenset({
+    'click here', 'here', 'link', 'read more', 'more', 'this', 'http', 'https', 'www',
+})
+_NON_DESCRIPTIVE_MAX_LEN = max(map(len, _NON_DESCRIPTIVE_LINKS))
+
+# Large-text paragraphs needed before the formatting issue is reported;
+# the scan stops counting once it gets there.
+_LARGE_TEXT_THRESHOLD = 4
+
+_HEADING_RE = re.compile(r'^Heading (\d+)$')
+
+# <w:pPr><w:pStyle w:val="..."/> holds a paragraph's style id
+_PSTYLE_PATH = qn('w:pPr') + '/' + qn('w:pStyle')
+_VAL_ATTR = qn('w:val')
+
+# Relationship targets of the main document part that point at images
+_DOCUMENT_RELS_PART = 'word/_rels/document.xml.rels'
+_IMAGE_REL_RE = re.compile(rb'Target="[^"]*image[^"]*"')
+
+# Audit reports keyed by (path, mtime_ns, size, detailed). Re-auditing an
+# unchanged file returns a copy of the stored report instead of re-parsing.
+_AUDIT_CACHE_MAXSIZE = 256
+_audit_cache: "OrderedDict[Tuple[str, int, int, bool], Dict[str, Any]]" = OrderedDict()
+
+
+@lru_cache(maxsize=None)
+def heading_level(style_name: str) -> Optional[int]:
+    """Return the level of a built-in "Heading N" style, or None for any other style."""
+    match = _HEADING_RE.match(style_name)
+    return int(match.group(1)) if match else None
+
+
+def count_image_rels(file_path: str) -> int:
+    """
+    Count image relationships of the main document part.
+    
+    Reads only the relationships XML from the DOCX archive instead of
+    building the whole python-docx object tree.
+    """
+    with zipfile.ZipFile(file_path) as archive:
+        try:
+            data = archive.read(_DOCUMENT_RELS_PART)
+        except KeyError:
+            return 0
+    return len(_IMAGE_REL_RE.findall(data))
+
+
+def iter_paragraph_styles(doc: Document) -> Iterator[Tuple[Paragraph, str]]:
+    """
+    Yield each body paragraph with its style name.
+    
+    Equivalent to para.style.name, but the style table is resolved once up
+    front and each paragraph only needs a single lxml lookup for its
+    w:pStyle id, rather than a python-docx style lookup per paragraph.
+    """
+    style_names = {
+        style.style_id: style.name or ""
+        for style in doc.styles
+        if style.type == WD_STYLE_TYPE.PARAGRAPH
+    }
+    default_style = doc.styles.default(WD_STYLE_TYPE.PARAGRAPH)
+    default_name = (default_style.name or "") if default_style is not None else ""
+    
+    for para in doc.paragraphs:
+        style_el = para._p.find(_PSTYLE_PATH)
+        style_id = style_el.get(_VAL_ATTR) if style_el is not None else None
+        yield para, style_names.get(style_id, default_name)
+
+
+@dataclass
+class ParaScan:
+    """Paragraph-level facts gathered in a single pass over the document."""
+    paragraph_count: int = 0
+    headings: List[Dict[str, Any]] = field(default_factory=list)
+    non_descriptive_links: List[str] = field(default_factory=list)
+    large_nonheading_count: int = 0  # capped at _LARGE_TEXT_THRESHOLD
+
+
+def _scan_paragraphs(doc: Document) -> ParaScan:
+    """Walk doc.paragraphs once, collecting what the paragraph checks need."""
+    scan = ParaScan()
+    
+    for para, style_name in iter_paragraph_styles(doc):
+        scan.paragraph_count += 1
+        is_heading = style_name.startswith('Heading')
+        
+        if is_heading:
+            level = heading_level(style_name)
+            if level is not None:
+                scan.headings.append({"level": level, "text": para.text})
+        
+        # Size checks only matter until the formatting threshold is reached
+        check_size = not is_heading and scan.large_nonheading_count < _LARGE_TEXT_THRESHOLD
+        has_large_run = False
+        for run in para.runs:
+            font = run.font
+            
+            # Underlined runs are treated as hyperlinks
+            if font.underline:
+                text = run.text.strip()
+                if len(text) <= _NON_DESCRIPTIVE_MAX_LEN:
+                    text = text.lower()
+                    if text in _NON_DESCRIPTIVE_LINKS:
+                        scan.non_descriptive_links.append(text)
+            
+            if check_size and not has_large_run:
+                size = font.size
+                if size and size.pt > 14:
+                    has_large_run = True
+        
+        if has_large_run:
+            scan.large_nonheading_count += 1
+    
+    return scan
+
+
+def clear_audit_cache() -> None:
+    """Drop all cached DOCX audit reports."""
+    _audit_cache.clear()
+
 
 async def audit_docx_accessibility(file_path: str, detailed: bool = True) -> Dict[str, Any]:
     """
     Perform comprehensive DOCX accessibility audit.
     
+    Results are cached per file path, modification time and size, so
+    repeated audits of an unchanged document skip parsing entirely.
+    
     Args:
         file_path: Path to DOCX file
         detailed: Include detailed analysis
@@ -24,78 +158,138 @@ async def audit_docx_accessibility(file_path: str, detailed: bool = True) -> Dic
     Returns:
         Audit report with issues categorized by WCAG principle
     """
-    issues = []
+    docx_path = Path(file_path)
+    if not docx_path.exists():
+        return {"error": f"File not found: {file_path}"}
+    
+    st = os.stat(file_path)
+    key = (os.path.abspath(file_path), st.st_mtime_ns, st.st_size, detailed)
+    cached = _audit_cache.get(key)
+    if cached is not None:
+        _audit_cache.move_to_end(key)
+        return copy.deepcopy(cached)
+    
+    # Detailed audits run their independent checks concurrently; quick ones
+    # stay on a single thread to avoid the fan-out overhead.
+    if detailed:
+        report = await _audit_concurrent(file_path)
+    else:
+        report = await asyncio.to_thread(_audit_sync, file_path, detailed)
+    
+    if "error" not in report:
+        _audit_cache[key] = copy.deepcopy(report)
+        if len(_audit_cache) > _AUDIT_CACHE_MAXSIZE:
+            _audit_cache.popitem(last=False)
+    
+    return report
+
+
+def _open_docx(file_path: str) -> Tuple[Document, ParaScan, Dict[str, Any]]:
+    """Parse the document, scan its paragraphs and extract basic metadata."""
+    doc = Document(file_path)
+    scan = _scan_paragraphs(doc)
+    
+    # core_properties creates its part lazily on first access; touch it here
+    # so checks running on worker threads only ever read it.
+    doc.core_properties
+    
+    metadata = {
+        "paragraphs": scan.paragraph_count,
+        "sections": len(doc.sections),
+        "tables": len(doc.tables),
+    }
+    return doc, scan, metadata
+
+
+def _check_calls(file_path: str, doc: Document, scan: ParaScan, detailed: bool) -> List[Tuple[Callable[[Any], List[Dict[str, Any]]], Any]]:
+    """List each check with the input it reads, in report order."""
+    calls = [
+        (check_heading_structure, scan),
+        (check_docx_alt_text_full, file_path),
+        (check_docx_tables_full, doc),
+        (check_hyperlinks, scan),
+        (check_docx_language, doc),
+        (check_docx_title, doc),
+    ]
+    
+    if detailed:
+        calls.append((check_list_structure, doc))
+        calls.append((check_text_formatting, scan))
+    
+    return calls
+
+
+def _build_report(file_path: str, metadata: Dict[str, Any], issues: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Categorize issues by WCAG principle and assemble the audit report."""
+    categorized = {
+        "Perceivable": [],
+        "Operable": [],
+        "Understandable": [],
+        "Robust": [],
+    }
     
+    for issue in issues:
+        principle = issue.get("wcag_principle", "Robust")
+        categorized[principle].append(issue)
+    
+    return {
+        "file": file_path,
+        "metadata": metadata,
+        "total_issues": len(issues),
+        "perceivable_count": len(categorized["Perceivable"]),
+        "operable_count": len(categorized["Operable"]),
+        "understandable_count": len(categorized["Understandable"]),
+        "robust_count": len(categorized["Robust"]),
+        "issues": issues,
+        "issues_by_principle": categorized,
+    }
+
+
+def _audit_sync(file_path: str, detailed: bool) -> Dict[str, Any]:
+    """Parse the document and run every check sequentially (uncached, blocking)."""
     try:
-        docx_path = Path(file_path)
-        if not docx_path.exists():
-            return {"error": f"File not found: {file_path}"}
-        
-        doc = Document(file_path)
+        doc, scan, metadata = _open_docx(file_path)
         
-        # Extract metadata
-        metadata = {
-            "paragraphs": len(doc.paragraphs),
-            "sections": len(doc.sections),
-            "tables": len(doc.tables),
-        }
+        issues = []
+        for check, arg in _check_calls(file_path, doc, scan, detailed):
+            issues.extend(check(arg))
         
-        # Run all checks
-        issues.extend(await check_heading_structure(doc))
-        issues.extend(await check_docx_alt_text_full(doc))
-        issues.extend(await check_docx_tables_full(doc))
-        issues.extend(await check_hyperlinks(doc))
-        issues.extend(await check_docx_language(doc))
-        issues.extend(await check_docx_title(doc))
-        
-        if detailed:
-            issues.extend(await check_list_structure(doc))
-            issues.extend(await check_text_formatting(doc))
+        return _build_report(file_path, metadata, issues)
+    
+    except Exception as e:
+        logger.error(f"Error auditing DOCX {file_path}: {e}", exc_info=True)
+        return {"error": str(e), "file": file_path}
+
+
+async def _audit_concurrent(file_path: str) -> Dict[str, Any]:
+    """Parse the document, then run every check on its own worker thread (uncached)."""
+    try:
+        doc, scan, metadata = await asyncio.to_thread(_open_docx, file_path)
         
-        # Categorize by WCAG principle
-        categorized = {
-            "Perceivable": [],
-            "Operable": [],
-            "Understandable": [],
-            "Robust": [],
-        }
+        results = await asyncio.gather(*(
+            asyncio.to_thread(check, arg)
+            for check, arg in _check_calls(file_path, doc, scan, detailed=True)
+        ))
         
-        for issue in issues:
-            principle = issue.get("wcag_principle", "Robust")
-            categorized[principle].append(issue)
+        issues = []
+        for result in results:
+            issues.extend(result)
         
-        return {
-            "file": file_path,
-            "metadata": metadata,
-            "total_issues": len(issues),
-            "perceivable_count": len(categorized["Perceivable"]),
-            "operable_count": len(categorized["Operable"]),
-            "understandable_count": len(categorized["Understandable"]),
-            "robust_count": len(categorized["Robust"]),
-            "issues": issues,
-            "issues_by_principle": categorized,
-        }
+        return _build_report(file_path, metadata, issues)
     
     except Exception as e:
         logger.error(f"Error auditing DOCX {file_path}: {e}", exc_info=True)
         return {"error": str(e), "file": file_path}
 
 
-async def check_heading_structure(doc: Document) -> List[Dict[str, Any]]:
+def check_heading_structure(scan: ParaScan) -> List[Dict[str, Any]]:
     """Check document heading structure and hierarchy."""
     issues = []
     
     try:
-        headings = []
-        for para in doc.paragraphs:
-            if para.style.name.startswith('Heading'):
-                try:
-                    level = int(para.style.name.split()[-1])
-                    headings.append({"level": level, "text": para.text})
-                except (ValueError, IndexError):
-                    pass
+        headings = scan.headings
         
-        if len(headings) == 0 and len(doc.paragraphs) > 20:
+        if len(headings) == 0 and scan.paragraph_count > 20:
             issues.append({
                 "wcag_principle": "Perceivable",
                 "success_criterion": "1.3.1",
@@ -130,17 +324,13 @@ async def check_heading_structure(doc: Document) -> List[Dict[str, Any]]:
     return issues
 
 
-async def check_docx_alt_text_full(doc: Document) -> List[Dict[str, Any]]:
+def check_docx_alt_text_full(file_path: str) -> List[Dict[str, Any]]:
     """Check alternative text for images and objects."""
     issues = []
     
     try:
-        images_without_alt = 0
-        
-        for rel in doc.part.rels.values():
-            if "image" in rel.target_ref:
-                # This is simplified - full check requires inspecting drawing elements
-                images_without_alt += 1
+        # This is simplified - full check requires inspecting drawing elements
+        images_without_alt = count_image_rels(file_path)
         
         if images_without_alt > 0:
             issues.append({
@@ -159,7 +349,7 @@ async def check_docx_alt_text_full(doc: Document) -> List[Dict[str, Any]]:
     return issues
 
 
-async def check_docx_tables_full(doc: Document) -> List[Dict[str, Any]]:
+def check_docx_tables_full(doc: Document) -> List[Dict[str, Any]]:
     """Check table accessibility."""
     issues = []
     
@@ -190,22 +380,12 @@ async def check_docx_tables_full(doc: Document) -> List[Dict[str, Any]]:
     return issues
 
 
-async def check_hyperlinks(doc: Document) -> List[Dict[str, Any]]:
+def check_hyperlinks(scan: ParaScan) -> List[Dict[str, Any]]:
     """Check hyperlink descriptiveness."""
     issues = []
     
     try:
-        non_descriptive_links = []
-        
-        for para in doc.paragraphs:
-            for run in para.runs:
-                # Check for hyperlinks
-                if run.font.underline:
-                    text = run.text.strip().lower()
-                    
-                    # Check for non-descriptive link text
-                    if text in ['click here', 'here', 'link', 'read more', 'more', 'this', 'http', 'https', 'www']:
-                        non_descriptive_links.append(text)
+        non_descriptive_links = scan.non_descriptive_links
         
         if non_descriptive_links:
             issues.append({
@@ -224,7 +404,7 @@ async def check_hyperlinks(doc: Document) -> List[Dict[str, Any]]:
     return issues
 
 
-async def check_docx_language(doc: Document) -> List[Dict[str, Any]]:
+def check_docx_language(doc: Document) -> List[Dict[str, Any]]:
     """Check document language setting."""
     issues = []
     
@@ -247,7 +427,7 @@ async def check_docx_language(doc: Document) -> List[Dict[str, Any]]:
     return issues
 
 
-async def check_docx_title(doc: Document) -> List[Dict[str, Any]]:
+def check_docx_title(doc: Document) -> List[Dict[str, Any]]:
     """Check document title."""
     issues = []
     
@@ -269,7 +449,7 @@ async def check_docx_title(doc: Document) -> List[Dict[str, Any]]:
     return issues
 
 
-async def check_list_structure(doc: Document) -> List[Dict[str, Any]]:
+def check_list_structure(doc: Document) -> List[Dict[str, Any]]:
     """Check if lists use proper list formatting."""
     issues = []
     
@@ -279,7 +459,7 @@ async def check_list_structure(doc: Document) -> List[Dict[str, Any]]:
     return issues
 
 
-async def check_text_formatting(doc: Document) -> List[Dict[str, Any]]:
+def check_text_formatting(scan: ParaScan) -> List[Dict[str, Any]]:
     """Check for color-only formatting or other issues."""
     issues = []
     
@@ -287,22 +467,15 @@ async def check_text_formatting(doc: Document) -> List[Dict[str, Any]]:
     # This is a heuristic check
     
     try:
-        large_text_not_headings = 0
-        
-        for para in doc.paragraphs:
-            if not para.style.name.startswith('Heading'):
-                for run in para.runs:
-                    if run.font.size and run.font.size.pt > 14:
-                        large_text_not_headings += 1
-                        break
+        large_text_not_headings = scan.large_nonheading_count
         
-        if large_text_not_headings > 3:
+        if large_text_not_headings >= _LARGE_TEXT_THRESHOLD:
             issues.append({
                 "wcag_principle": "Perceivable",
                 "success_criterion": "1.3.1",
                 "success_criterion_name": "Info and Relationships",
                 "severity": "minor",
-                "description": f"Found {large_text_not_headings} paragraphs with large text that are not using Heading styles. Visual formatting alone is not accessible.",
+                "description": f"Found at least {large_text_not_headings} paragraphs with large text that are not using Heading styles. Visual formatting alone is not accessible.",
                 "remediation": "Use built-in Heading styles instead of manual font sizing to create document structure.",
                 "detection_source": "docx-formatting-check",
             })
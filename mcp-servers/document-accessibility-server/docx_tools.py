@@ -2,26 +2,44 @@
 DOCX-specific accessibility tools.
 """
 
-from typing import Dict, Any, List
+import os
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
 from docx import Document
 
+from docx_auditor import count_image_rels, heading_level, iter_paragraph_styles
 
-def extract_docx_structure(file_path: str) -> Dict[str, Any]:
+# Link texts flagged by check_docx_hyperlinks
+_NON_DESCRIPTIVE_LINKS = frozenset({'click here', 'here', 'link', 'read more'})
+_NON_DESCRIPTIVE_MAX_LEN = max(map(len, _NON_DESCRIPTIVE_LINKS))
+
+
+@lru_cache(maxsize=32)
+def _load_doc(file_path: str, mtime_ns: int) -> Document:
+    """Parse a DOCX once per (path, mtime); later calls reuse the Document."""
+    return Document(file_path)
+
+
+def _get_doc(file_path: Optional[str], doc: Optional[Document]) -> Document:
+    """Return the given Document, or load file_path through the cache."""
+    if doc is not None:
+        return doc
+    return _load_doc(file_path, os.stat(file_path).st_mtime_ns)
+
+
+def extract_docx_structure(file_path: Optional[str] = None, *, doc: Optional[Document] = None) -> Dict[str, Any]:
     """Extract DOCX structure information."""
     try:
-        doc = Document(file_path)
+        doc = _get_doc(file_path, doc)
         
         headings = []
-        for para in doc.paragraphs:
-            if para.style.name.startswith('Heading'):
-                try:
-                    level = int(para.style.name.split()[-1])
-                    headings.append({
-                        "level": level,
-                        "text": para.text[:100],  # First 100 chars
-                    })
-                except (ValueError, IndexError):
-                    pass
+        for para, style_name in iter_paragraph_styles(doc):
+            level = heading_level(style_name)
+            if level is not None:
+                headings.append({
+                    "level": level,
+                    "text": para.text[:100],  # First 100 chars
+                })
         
         return {
             "paragraphs": len(doc.paragraphs),
@@ -35,19 +53,16 @@ def extract_docx_structure(file_path: str) -> Dict[str, Any]:
         return {"error": str(e)}
 
 
-def check_docx_headings(file_path: str) -> Dict[str, Any]:
+def check_docx_headings(file_path: Optional[str] = None, *, doc: Optional[Document] = None) -> Dict[str, Any]:
     """Check heading structure."""
     try:
-        doc = Document(file_path)
+        doc = _get_doc(file_path, doc)
         headings = []
         
-        for para in doc.paragraphs:
-            if para.style.name.startswith('Heading'):
-                try:
-                    level = int(para.style.name.split()[-1])
-                    headings.append({"level": level, "text": para.text})
-                except (ValueError, IndexError):
-                    pass
+        for para, style_name in iter_paragraph_styles(doc):
+            level = heading_level(style_name)
+            if level is not None:
+                headings.append({"level": level, "text": para.text})
         
         issues = []
         if len(headings) == 0:
@@ -68,15 +83,17 @@ def check_docx_headings(file_path: str) -> Dict[str, Any]:
         return {"error": str(e)}
 
 
-def check_docx_alt_text(file_path: str) -> Dict[str, Any]:
+def check_docx_alt_text(file_path: Optional[str] = None, *, doc: Optional[Document] = None) -> Dict[str, Any]:
     """Check alt text for images."""
     try:
-        doc = Document(file_path)
-        
-        image_count = 0
-        for rel in doc.part.rels.values():
-            if "image" in rel.target_ref:
-                image_count += 1
+        if doc is None:
+            # Only the relationships part is needed; skip loading the Document
+            image_count = count_image_rels(file_path)
+        else:
+            image_count = 0
+            for rel in doc.part.rels.values():
+                if "image" in rel.target_ref:
+                    image_count += 1
         
         return {
             "image_count": image_count,
@@ -87,10 +104,10 @@ def check_docx_alt_text(file_path: str) -> Dict[str, Any]:
         return {"error": str(e)}
 
 
-def check_docx_tables(file_path: str) -> Dict[str, Any]:
+def check_docx_tables(file_path: Optional[str] = None, *, doc: Optional[Document] = None) -> Dict[str, Any]:
     """Check table structure."""
     try:
-        doc = Document(file_path)
+        doc = _get_doc(file_path, doc)
         
         tables_info = []
         for table in doc.tables:
@@ -109,18 +126,20 @@ def check_docx_tables(file_path: str) -> Dict[str, Any]:
         return {"error": str(e)}
 
 
-def check_docx_hyperlinks(file_path: str) -> Dict[str, Any]:
+def check_docx_hyperlinks(file_path: Optional[str] = None, *, doc: Optional[Document] = None) -> Dict[str, Any]:
     """Check hyperlink descriptiveness."""
     try:
-        doc = Document(file_path)
+        doc = _get_doc(file_path, doc)
         
         potential_issues = []
         for para in doc.paragraphs:
             for run in para.runs:
                 if run.font.underline:
-                    text = run.text.strip().lower()
-                    if text in ['click here', 'here', 'link', 'read more']:
-                        potential_issues.append(text)
+                    text = run.text.strip()
+                    if len(text) <= _NON_DESCRIPTIVE_MAX_LEN:
+                        text = text.lower()
+                        if text in _NON_DESCRIPTIVE_LINKS:
+                            potential_issues.append(text)
         
         return {
             "non_descriptive_links": len(potential_issues),
@@ -130,3 +149,19 @@ def check_docx_hyperlinks(file_path: str) -> Dict[str, Any]:
     
     except Exception as e:
         return {"error": str(e)}
+
+
+def check_docx_all(file_path: str) -> Dict[str, Any]:
+    """Run every DOCX check against a single parse of the document."""
+    try:
+        doc = _get_doc(file_path, None)
+    except Exception as e:
+        return {"error": str(e)}
+    
+    return {
+        "structure": extract_docx_structure(doc=doc),
+        "headings": check_docx_headings(doc=doc),
+        "alt_text": check_docx_alt_text(file_path),
+        "tables": check_docx_tables(doc=doc),
+        "hyperlinks": check_docx_hyperlinks(doc=doc),
+    }
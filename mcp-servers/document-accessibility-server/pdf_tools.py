@@ -3,25 +3,25 @@ PDF-specific accessibility tools.
 """
 
 from typing import Dict, Any, List
-import pypdf
 import fitz
-import pdfplumber
+
+from pdf_auditor import catalog_has_key, fast_has_catalog_key, iter_page_images
+
+# Images listed individually by check_pdf_alt_text; the total is always exact
+MAX_IMAGE_SAMPLE = 50
 
 
 def extract_pdf_structure(file_path: str) -> Dict[str, Any]:
     """Extract PDF structure information."""
     try:
-        doc = fitz.open(file_path)
-        toc = doc.get_toc()
-        
-        structure = {
-            "pages": doc.page_count,
-            "bookmarks": len(toc),
-            "outline": [{"level": level, "title": title, "page": page} for level, title, page in toc],
-        }
-        
-        doc.close()
-        return structure
+        with fitz.open(file_path) as doc:
+            toc = doc.get_toc()
+            
+            return {
+                "pages": doc.page_count,
+                "bookmarks": len(toc),
+                "outline": [{"level": level, "title": title, "page": page} for level, title, page in toc],
+            }
     
     except Exception as e:
         return {"error": str(e)}
@@ -30,19 +30,15 @@ def extract_pdf_structure(file_path: str) -> Dict[str, Any]:
 def check_pdf_tags(file_path: str) -> Dict[str, Any]:
     """Check PDF tagging status."""
     try:
-        with open(file_path, 'rb') as f:
-            reader = pypdf.PdfReader(f)
-            
-            has_structure = False
-            if reader.trailer.get("/Root"):
-                root = reader.trailer["/Root"]
-                if isinstance(root, pypdf.generic.DictionaryObject):
-                    has_structure = "/StructTreeRoot" in root
-            
-            return {
-                "tagged": has_structure,
-                "message": "PDF is tagged" if has_structure else "PDF is not tagged (required for PDF/UA compliance)"
-            }
+        has_structure = fast_has_catalog_key(file_path, "StructTreeRoot")
+        if has_structure is None:
+            with fitz.open(file_path) as doc:
+                has_structure = catalog_has_key(doc, "StructTreeRoot")
+        
+        return {
+            "tagged": has_structure,
+            "message": "PDF is tagged" if has_structure else "PDF is not tagged (required for PDF/UA compliance)"
+        }
     
     except Exception as e:
         return {"error": str(e)}
@@ -51,26 +47,23 @@ def check_pdf_tags(file_path: str) -> Dict[str, Any]:
 def check_pdf_alt_text(file_path: str) -> Dict[str, Any]:
     """Check for images and their alt text."""
     try:
-        doc = fitz.open(file_path)
         images_info = []
+        total_images = 0
         
-        for page_num in range(doc.page_count):
-            page = doc[page_num]
-            images = page.get_images()
-            
-            for img_index, img in enumerate(images):
-                images_info.append({
-                    "page": page_num + 1,
-                    "index": img_index + 1,
-                    "needs_verification": True,
-                })
-        
-        doc.close()
+        with fitz.open(file_path) as doc:
+            for page_num, img_index in iter_page_images(doc):
+                total_images += 1
+                if total_images <= MAX_IMAGE_SAMPLE:
+                    images_info.append({
+                        "page": page_num,
+                        "index": img_index,
+                        "needs_verification": True,
+                    })
         
         return {
-            "total_images": len(images_info),
+            "total_images": total_images,
             "images": images_info,
-            "message": f"Found {len(images_info)} images - verify all have alt text"
+            "message": f"Found {total_images} images - verify all have alt text"
         }
     
     except Exception as e:
@@ -80,13 +73,13 @@ def check_pdf_alt_text(file_path: str) -> Dict[str, Any]:
 def check_pdf_reading_order(file_path: str) -> Dict[str, Any]:
     """Check reading order."""
     try:
-        with pdfplumber.open(file_path) as pdf:
+        with fitz.open(file_path) as doc:
             reading_order = []
             
-            for page_num, page in enumerate(pdf.pages):
-                words = page.extract_words()
+            for page in doc:
+                words = page.get_text("words")
                 reading_order.append({
-                    "page": page_num + 1,
+                    "page": page.number + 1,
                     "word_count": len(words),
                     "needs_manual_verification": True,
                 })
@@ -7,6 +7,7 @@ following PDF/UA (ISO 14289) and WCAG 2.2 AA standards.
 
 Tools:
 - audit_pdf: Comprehensive PDF accessibility audit
+- audit_pdf_batch: Audit several PDFs in parallel
 - audit_docx: Comprehensive DOCX accessibility audit
 - extract_pdf_structure: Extract PDF structure information
 - extract_docx_structure: Extract DOCX structure information
@@ -21,11 +22,21 @@ import json
 import logging
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # optional speedup, fall back to stdlib json
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:  # optional speedup (not available on Windows), fall back to asyncio's loop
+    uvloop = None
+
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 
-from pdf_auditor import audit_pdf_accessibility
+from pdf_auditor import audit_pdf_accessibility, audit_pdf_batch
 from docx_auditor import audit_docx_accessibility
 from pdf_tools import (
     extract_pdf_structure,
@@ -50,203 +61,250 @@ logger = logging.getLogger("document-accessibility-server")
 server = Server("document-accessibility-server")
 
 
-@server.list_tools()
-async def list_tools() -> list[Tool]:
-    """List available document accessibility tools."""
-    return [
-        Tool(
-            name="audit_pdf",
-            description="""Perform comprehensive PDF accessibility audit following PDF/UA and WCAG 2.2 AA standards.
-            
-            Checks include:
-            - Document structure and tagging (headings, reading order, logical structure)
-            - Alternative text for images, charts, and graphics
-            - Color contrast for text and backgrounds
-            - Form field accessibility (labels, tab order)
-            - Language specification and metadata
-            - Table structure (headers, scope, relationships)
-            - Navigation and bookmarks
-            - Security settings affecting accessibility
-            
-            Returns detailed report with issues categorized by WCAG principle and severity.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "Path to the PDF file to audit"
-                    },
-                    "detailed": {
-                        "type": "boolean",
-                        "description": "Include detailed analysis (slower but more thorough)",
-                        "default": True
-                    }
-                },
-                "required": ["file_path"]
-            }
-        ),
-        Tool(
-            name="audit_docx",
-            description="""Perform comprehensive DOCX accessibility audit following WCAG 2.2 AA standards.
-            
-            Checks include:
-            - Heading structure and hierarchy
-            - Alternative text for images and objects
-            - Table accessibility (headers, simple structure)
-            - Hyperlink text descriptiveness
-            - Color contrast for text
-            - Reading order
-            - Metadata and language settings
-            - Built-in accessibility checker results
-            
-            Returns detailed report with issues categorized by WCAG principle and severity.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "Path to the DOCX file to audit"
-                    },
-                    "detailed": {
-                        "type": "boolean",
-                        "description": "Include detailed analysis",
-                        "default": True
-                    }
-                },
-                "required": ["file_path"]
-            }
-        ),
-        Tool(
-            name="extract_pdf_structure",
-            description="Extract structure information from PDF (headings, tags, reading order)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {"type": "string", "description": "Path to PDF file"}
-                },
-                "required": ["file_path"]
-            }
-        ),
-        Tool(
-            name="extract_docx_structure",
-            description="Extract structure information from DOCX (headings, styles, sections)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {"type": "string", "description": "Path to DOCX file"}
-                },
-                "required": ["file_path"]
-            }
-        ),
-        Tool(
-            name="check_pdf_tags",
-            description="Validate PDF tagging and structure compliance with PDF/UA",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {"type": "string", "description": "Path to PDF file"}
+def _dump(result: Any) -> str:
+    """Serialize a tool result as indented JSON text."""
+    if orjson is None:
+        return json.dumps(result, indent=2)
+    return orjson.dumps(
+        result,
+        default=str,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+    ).decode()
+
+
+# Built once at import; list_tools hands back the same list every call
+_TOOLS: list[Tool] = [
+    Tool(
+        name="audit_pdf",
+        description="""Perform comprehensive PDF accessibility audit following PDF/UA and WCAG 2.2 AA standards.
+        
+        Checks include:
+        - Document structure and tagging (headings, reading order, logical structure)
+        - Alternative text for images, charts, and graphics
+        - Color contrast for text and backgrounds
+        - Form field accessibility (labels, tab order)
+        - Language specification and metadata
+        - Table structure (headers, scope, relationships)
+        - Navigation and bookmarks
+        - Security settings affecting accessibility
+        
+        Returns detailed report with issues categorized by WCAG principle and severity.""",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to the PDF file to audit"
                 },
-                "required": ["file_path"]
-            }
-        ),
-        Tool(
-            name="check_alt_text",
-            description="Check for missing or inadequate alternative text in PDF or DOCX",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {"type": "string", "description": "Path to document file"},
-                    "file_type": {
-                        "type": "string",
-                        "enum": ["pdf", "docx"],
-                        "description": "Document type"
-                    }
+                "detailed": {
+                    "type": "boolean",
+                    "description": "Include detailed analysis (slower but more thorough)",
+                    "default": True
+                }
+            },
+            "required": ["file_path"]
+        }
+    ),
+    Tool(
+        name="audit_pdf_batch",
+        description="""Audit several PDF files in one call using a shared pool of worker processes.
+        
+        Runs the same checks as audit_pdf on each file and returns one entry per file
+        with its status and issues (or the error that stopped the audit).""",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_paths": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Paths to the PDF files to audit"
                 },
-                "required": ["file_path", "file_type"]
-            }
-        ),
-        Tool(
-            name="check_reading_order",
-            description="Validate logical reading order in PDF document",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {"type": "string", "description": "Path to PDF file"}
+                "detailed": {
+                    "type": "boolean",
+                    "description": "Include detailed analysis (slower but more thorough)",
+                    "default": True
                 },
-                "required": ["file_path"]
-            }
-        ),
-        Tool(
-            name="check_color_contrast",
-            description="Analyze color contrast ratios in PDF document",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {"type": "string", "description": "Path to PDF file"},
-                    "wcag_level": {
-                        "type": "string",
-                        "enum": ["AA", "AAA"],
-                        "description": "WCAG conformance level",
-                        "default": "AA"
-                    }
+                "workers": {
+                    "type": "integer",
+                    "description": "Number of worker processes (defaults to min(CPU count, 4))",
+                    "minimum": 1
+                }
+            },
+            "required": ["file_paths"]
+        }
+    ),
+    Tool(
+        name="audit_docx",
+        description="""Perform comprehensive DOCX accessibility audit following WCAG 2.2 AA standards.
+        
+        Checks include:
+        - Heading structure and hierarchy
+        - Alternative text for images and objects
+        - Table accessibility (headers, simple structure)
+        - Hyperlink text descriptiveness
+        - Color contrast for text
+        - Reading order
+        - Metadata and language settings
+        - Built-in accessibility checker results
+        
+        Returns detailed report with issues categorized by WCAG principle and severity.""",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to the DOCX file to audit"
                 },
-                "required": ["file_path"]
-            }
-        ),
-    ]
+                "detailed": {
+                    "type": "boolean",
+                    "description": "Include detailed analysis",
+                    "default": True
+                }
+            },
+            "required": ["file_path"]
+        }
+    ),
+    Tool(
+        name="extract_pdf_structure",
+        description="Extract structure information from PDF (headings, tags, reading order)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {"type": "string", "description": "Path to PDF file"}
+            },
+            "required": ["file_path"]
+        }
+    ),
+    Tool(
+        name="extract_docx_structure",
+        description="Extract structure information from DOCX (headings, styles, sections)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {"type": "string", "description": "Path to DOCX file"}
+            },
+            "required": ["file_path"]
+        }
+    ),
+    Tool(
+        name="check_pdf_tags",
+        description="Validate PDF tagging and structure compliance with PDF/UA",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {"type": "string", "description": "Path to PDF file"}
+            },
+            "required": ["file_path"]
+        }
+    ),
+    Tool(
+        name="check_alt_text",
+        description="Check for missing or inadequate alternative text in PDF or DOCX",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {"type": "string", "description": "Path to document file"},
+                "file_type": {
+                    "type": "string",
+                    "enum": ["pdf", "docx"],
+                    "description": "Document type"
+                }
+            },
+            "required": ["file_path", "file_type"]
+        }
+    ),
+    Tool(
+        name="check_reading_order",
+        description="Validate logical reading order in PDF document",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {"type": "string", "description": "Path to PDF file"}
+            },
+            "required": ["file_path"]
+        }
+    ),
+    Tool(
+        name="check_color_contrast",
+        description="Analyze color contrast ratios in PDF document",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {"type": "string", "description": "Path to PDF file"},
+                "wcag_level": {
+                    "type": "string",
+                    "enum": ["AA", "AAA"],
+                    "description": "WCAG conformance level",
+                    "default": "AA"
+                }
+            },
+            "required": ["file_path"]
+        }
+    ),
+]
+
+@server.list_tools()
+async def list_tools() -> list[Tool]:
+    """List available document accessibility tools."""
+    return _TOOLS
+
+
+def _path_args(arguments: Any) -> dict:
+    return {"file_path": arguments["file_path"]}
+
+
+def _audit_args(arguments: Any) -> dict:
+    return {"file_path": arguments["file_path"], "detailed": arguments.get("detailed", True)}
+
+
+def _batch_args(arguments: Any) -> dict:
+    return {
+        "file_paths": arguments["file_paths"],
+        "detailed": arguments.get("detailed", True),
+        "workers": arguments.get("workers"),
+    }
+
+
+def _alt_text_args(arguments: Any) -> dict:
+    return {"file_path": arguments["file_path"], "file_type": arguments["file_type"]}
+
+
+def _contrast_args(arguments: Any) -> dict:
+    return {"file_path": arguments["file_path"], "wcag_level": arguments.get("wcag_level", "AA")}
+
+
+def _check_alt_text(file_path: str, file_type: str) -> dict:
+    if file_type == "pdf":
+        return check_pdf_alt_text(file_path)
+    return check_docx_alt_text(file_path)
+
+
+# Tool name -> (handler, is_async, builds the handler's kwargs from the call arguments)
+_DISPATCH = {
+    "audit_pdf": (audit_pdf_accessibility, True, _audit_args),
+    "audit_pdf_batch": (audit_pdf_batch, True, _batch_args),
+    "audit_docx": (audit_docx_accessibility, True, _audit_args),
+    "extract_pdf_structure": (extract_pdf_structure, False, _path_args),
+    "extract_docx_structure": (extract_docx_structure, False, _path_args),
+    "check_pdf_tags": (check_pdf_tags, False, _path_args),
+    "check_alt_text": (_check_alt_text, False, _alt_text_args),
+    "check_reading_order": (check_pdf_reading_order, False, _path_args),
+    "check_color_contrast": (check_pdf_contrast, False, _contrast_args),
+}
 
 
 @server.call_tool()
 async def call_tool(name: str, arguments: Any) -> list[TextContent]:
     """Handle tool calls for document accessibility auditing."""
     try:
-        if name == "audit_pdf":
-            result = await audit_pdf_accessibility(
-                arguments["file_path"],
-                detailed=arguments.get("detailed", True)
-            )
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        
-        elif name == "audit_docx":
-            result = await audit_docx_accessibility(
-                arguments["file_path"],
-                detailed=arguments.get("detailed", True)
-            )
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        
-        elif name == "extract_pdf_structure":
-            result = extract_pdf_structure(arguments["file_path"])
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        
-        elif name == "extract_docx_structure":
-            result = extract_docx_structure(arguments["file_path"])
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        
-        elif name == "check_pdf_tags":
-            result = check_pdf_tags(arguments["file_path"])
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        
-        elif name == "check_alt_text":
-            file_type = arguments["file_type"]
-            if file_type == "pdf":
-                result = check_pdf_alt_text(arguments["file_path"])
-            else:
-                result = check_docx_alt_text(arguments["file_path"])
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        
-        elif name == "check_reading_order":
-            result = check_pdf_reading_order(arguments["file_path"])
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        
-        elif name == "check_color_contrast":
-            result = check_pdf_contrast(
-                arguments["file_path"],
-                wcag_level=arguments.get("wcag_level", "AA")
-            )
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-        
-        else:
+        entry = _DISPATCH.get(name)
+        if entry is None:
             raise ValueError(f"Unknown tool: {name}")
+        
+        handler, is_async, build_args = entry
+        kwargs = build_args(arguments)
+        result = await handler(**kwargs) if is_async else handler(**kwargs)
+        return [TextContent(type="text", text=_dump(result))]
     
     except Exception as e:
         logger.error(f"Error in tool {name}: {e}", exc_info=True)
@@ -268,4 +326,7 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
@@ -0,0 +1,33 @@
+"""
+Tests for the DOCX auditor.
+"""
+
+import asyncio
+
+import docx
+import pytest
+
+import docx_auditor
+from docx_auditor import audit_docx_accessibility
+
+
+@pytest.fixture
+def sample_docx(tmp_path):
+    path = tmp_path / "sample.docx"
+    document = docx.Document()
+    document.add_heading("Title", level=1)
+    document.add_paragraph("Body text")
+    document.save(str(path))
+    return path
+
+
+def test_audit_cache_shared_by_relative_and_absolute_paths(sample_docx, monkeypatch):
+    """Test the same file is cached once whether given by a relative or an absolute path."""
+    docx_auditor._audit_cache.clear()
+    monkeypatch.chdir(sample_docx.parent)
+    
+    relative = asyncio.run(audit_docx_accessibility(sample_docx.name, detailed=False))
+    absolute = asyncio.run(audit_docx_accessibility(str(sample_docx), detailed=False))
+    
+    assert relative == absolute
+    assert len(docx_auditor._audit_cache) == 1
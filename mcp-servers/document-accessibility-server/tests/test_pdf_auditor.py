@@ -0,0 +1,104 @@
+"""
+Tests for the PDF auditor.
+"""
+
+import asyncio
+
+import fitz
+import pytest
+
+from pdf_auditor import _page_has_table, _scan_pages, _scan_pages_parallel, audit_pdf_accessibility
+
+
+def _write_pdf(path, **save_options):
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), "Hello")
+    doc.save(str(path), **save_options)
+    doc.close()
+
+
+@pytest.fixture
+def owner_password_pdf(tmp_path):
+    """PDF restricted by an owner password, with an empty user password."""
+    path = tmp_path / "restricted.pdf"
+    _write_pdf(
+        path,
+        encryption=fitz.PDF_ENCRYPT_RC4_128,
+        owner_pw="owner",
+        user_pw="",
+        permissions=fitz.PDF_PERM_PRINT,
+    )
+    return path
+
+
+def test_owner_password_pdf_reported_encrypted(owner_password_pdf):
+    """Test a permissions-restricted PDF that opens without a password is still reported as encrypted."""
+    result = asyncio.run(audit_pdf_accessibility(str(owner_password_pdf), detailed=False, parallel_pages=False))
+    
+    assert result["metadata"]["encrypted"] is True
+
+
+def test_unencrypted_pdf_not_reported_encrypted(tmp_path):
+    """Test a plain PDF is not reported as encrypted."""
+    path = tmp_path / "plain.pdf"
+    _write_pdf(path)
+    
+    result = asyncio.run(audit_pdf_accessibility(str(path), detailed=False, parallel_pages=False))
+    
+    assert result["metadata"]["encrypted"] is False
+
+
+def test_outlined_callout_boxes_not_detected_as_table():
+    """Test a page with a few stroked boxes around text has no table."""
+    doc = fitz.open()
+    page = doc.new_page()
+    for top in (72, 272, 472):
+        page.draw_rect(fitz.Rect(72, top, 520, top + 120), color=(0, 0, 0))
+        page.insert_text((90, top + 30), "Note")
+    
+    assert _page_has_table(page) is False
+
+
+def test_filled_background_and_bars_not_detected_as_table():
+    """Test fill-only shapes such as a page background and header/footer bars are not ruling lines."""
+    doc = fitz.open()
+    page = doc.new_page()
+    page.draw_rect(page.rect, color=None, fill=(0.95, 0.95, 0.9))
+    page.draw_rect(fitz.Rect(0, 0, page.rect.width, 40), color=None, fill=(0, 0, 0.5))
+    page.draw_rect(fitz.Rect(0, page.rect.height - 40, page.rect.width, page.rect.height), color=None, fill=(0, 0, 0.5))
+    page.insert_text((72, 100), "Body text")
+    
+    assert _page_has_table(page) is False
+
+
+def test_ruled_grid_detected_as_table():
+    """Test a grid of stroked horizontal and vertical rules is detected as a table."""
+    doc = fitz.open()
+    page = doc.new_page()
+    for i in range(5):
+        page.draw_line((72, 100 + i * 30), (472, 100 + i * 30))
+        page.draw_line((72 + i * 100, 100), (72 + i * 100, 220))
+    
+    assert _page_has_table(page) is True
+
+
+def test_parallel_page_scan_matches_serial_scan(tmp_path):
+    """Test the process-pool page scan returns the same totals as an in-process scan."""
+    path = tmp_path / "long.pdf"
+    doc = fitz.open()
+    for number in range(12):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Page {number + 1}")
+        if number % 3 == 0:
+            for i in range(5):
+                page.draw_line((72, 100 + i * 30), (472, 100 + i * 30))
+                page.draw_line((72 + i * 100, 100), (72 + i * 100, 220))
+    doc.save(str(path))
+    doc.close()
+    
+    with fitz.open(str(path)) as doc:
+        serial = _scan_pages(doc)
+    parallel = asyncio.run(_scan_pages_parallel(str(path), 12))
+    
+    assert parallel == serial
+    assert serial.tables == 4
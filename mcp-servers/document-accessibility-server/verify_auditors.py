@@ -1,28 +1,52 @@
 import asyncio
 import json
 import os
+
+try:
+    import orjson
+except ImportError:  # optional speedup, fall back to stdlib json
+    orjson = None
+
 from docx_auditor import audit_docx_accessibility
 from pdf_auditor import audit_pdf_accessibility
 
+AUDITS = [
+    ("DOCX", "test_bad.docx", audit_docx_accessibility),
+    ("PDF", "test_bad.pdf", audit_pdf_accessibility),
+]
+
+def _dump(result) -> str:
+    """Pretty-print an audit result, using orjson when available."""
+    if orjson is None:
+        return json.dumps(result, indent=2)
+    return orjson.dumps(result, option=orjson.OPT_INDENT_2, default=str).decode()
+
 async def main():
-    print("--- Running DOCX Audit ---")
-    docx_path = os.path.abspath("test_bad.docx")
-    if os.path.exists(docx_path):
-        result_docx = await audit_docx_accessibility(docx_path)
-        print(json.dumps(result_docx, indent=2))
-    else:
-        print("test_bad.docx not found!")
+    # The audits are independent, so run them concurrently and print in order.
+    # Existence is checked once and results are keyed by label, so a file
+    # appearing or vanishing mid-run can't shift results onto the wrong audit.
+    existing = [
+        (label, audit, os.path.abspath(filename))
+        for label, filename, audit in AUDITS
+        if os.path.exists(os.path.abspath(filename))
+    ]
+    results = await asyncio.gather(
+        *(audit(path) for _, audit, path in existing),
+        return_exceptions=True,
+    )
+    results = {label: result for (label, _, _), result in zip(existing, results)}
 
-    print("\n--- Running PDF Audit ---")
-    pdf_path = os.path.abspath("test_bad.pdf")
-    if os.path.exists(pdf_path):
-        try:
-            result_pdf = await audit_pdf_accessibility(pdf_path)
-            print(json.dumps(result_pdf, indent=2))
-        except Exception as e:
-            print(f"PDF Audit failed: {e}")
-    else:
-        print("test_bad.pdf not found!")
+    for label, filename, _ in AUDITS:
+        print(f"--- Running {label} Audit ---")
+        if label not in results:
+            print(f"{filename} not found!")
+        else:
+            result = results[label]
+            if isinstance(result, Exception):
+                print(f"{label} Audit failed: {result}")
+            else:
+                print(_dump(result))
+        print()
 
 if __name__ == "__main__":
     asyncio.run(main())
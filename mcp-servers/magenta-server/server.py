@@ -5,12 +5,104 @@ Provides tools for accessing Magenta A11y component testing patterns
 """
 
 import asyncio
+import contextlib
+import random
+import signal
+import time
+from types import MappingProxyType
 import httpx
+from aiolimiter import AsyncLimiter
 from mcp.server import Server
 from mcp.types import Tool, TextContent
 
+try:
+    import uvloop
+except ImportError:  # optional speedup (not available on Windows), fall back to asyncio's loop
+    uvloop = None
+
 app = Server("ally-checker-magenta")
 
+# One pooled client for the server's lifetime so repeated fetches reuse
+# connections instead of paying a TCP+TLS handshake per call; HTTP/2 lets
+# concurrent checklist fetches multiplex over a single connection
+_client: httpx.AsyncClient | None = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=True,
+            follow_redirects=True,
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0),
+        )
+    return _client
+
+
+# Every checklist lives on magentaa11y.com, so one limiter paces all outbound
+# requests; 429/503 responses and timeouts are retried with jittered backoff
+_LIMITER = AsyncLimiter(max_rate=5, time_period=1)
+_RETRY_STATUSES = frozenset({429, 503})
+_MAX_ATTEMPTS = 3
+
+
+async def _rate_limited_get(url: str, headers: dict[str, str]) -> httpx.Response:
+    """GET a Magenta URL under the shared rate limit, retrying transient failures."""
+    for attempt in range(_MAX_ATTEMPTS - 1):
+        async with _LIMITER:
+            try:
+                response = await get_client().get(url, headers=headers)
+                if response.status_code not in _RETRY_STATUSES:
+                    return response
+            except httpx.TimeoutException:
+                pass
+        await asyncio.sleep(min(8.0, 0.5 * 2 ** attempt) + random.uniform(0, 0.5))
+    
+    async with _LIMITER:
+        return await get_client().get(url, headers=headers)
+
+
+# Checklist previews keyed by URL: (fetched_at, etag, last_modified, preview).
+# Fresh entries are served directly; stale ones are revalidated with a conditional GET.
+_PREVIEW_CACHE: dict[str, tuple[float, str | None, str | None, str]] = {}
+_PREVIEW_CACHE_TTL = 3600.0
+_PREVIEW_BYTES = 3000
+
+
+async def fetch_checklist_preview(url: str) -> str:
+    """Fetch the start of a Magenta checklist page, reusing cached copies when unchanged."""
+    cached = _PREVIEW_CACHE.get(url)
+    now = time.monotonic()
+    if cached is not None and now - cached[0] < _PREVIEW_CACHE_TTL:
+        return cached[3]
+    
+    headers = {}
+    if cached is not None:
+        if cached[1]:
+            headers["If-None-Match"] = cached[1]
+        if cached[2]:
+            headers["If-Modified-Since"] = cached[2]
+    
+    response = await _rate_limited_get(url, headers)
+    if response.status_code == 304 and cached is not None:
+        _PREVIEW_CACHE[url] = (now, cached[1], cached[2], cached[3])
+        return cached[3]
+    response.raise_for_status()
+    
+    # Decode just the previewed bytes instead of the whole page
+    preview = response.content[:_PREVIEW_BYTES].decode(
+        response.charset_encoding or "utf-8", errors="replace"
+    )
+    _PREVIEW_CACHE[url] = (
+        now,
+        response.headers.get("etag"),
+        response.headers.get("last-modified"),
+        preview,
+    )
+    return preview
+
 # Magenta A11y Component Categories
 MAGENTA_COMPONENTS = {
     "button": {
@@ -95,152 +187,18 @@ MAGENTA_COMPONENTS = {
     }
 }
 
-@app.list_tools()
-async def list_tools() -> list[Tool]:
-    """List available Magenta A11y tools"""
-    return [
-        Tool(
-            name="get_magenta_component",
-            description="Get Magenta A11y testing checklist for a specific component (button, form, dialog, tabs, etc.)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "component": {
-                        "type": "string",
-                        "description": "Component name",
-                        "enum": list(MAGENTA_COMPONENTS.keys())
-                    }
-                },
-                "required": ["component"]
-            }
-        ),
-        Tool(
-            name="search_magenta_patterns",
-            description="Search Magenta A11y for components matching a description or category",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Search query (e.g., 'forms', 'interactive', 'navigation')"
-                    }
-                },
-                "required": ["query"]
-            }
-        ),
-        Tool(
-            name="get_magenta_testing_methods",
-            description="Get general testing methods from Magenta A11y (keyboard, screen reader, visual)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "method": {
-                        "type": "string",
-                        "description": "Testing method",
-                        "enum": ["keyboard", "screen-reader", "visual", "all"]
-                    }
-                },
-                "required": ["method"]
-            }
-        )
-    ]
-
-@app.call_tool()
-async def call_tool(name: str, arguments: dict) -> list[TextContent]:
-    """Handle tool calls"""
-    
-    if name == "get_magenta_component":
-        component = arguments["component"]
-        
-        if component not in MAGENTA_COMPONENTS:
-            return [TextContent(
-                type="text",
-                text=f"Error: Unknown component '{component}'. Available: {', '.join(MAGENTA_COMPONENTS.keys())}"
-            )]
-        
-        comp_data = MAGENTA_COMPONENTS[component]
-        url = comp_data["url"]
-        
-        try:
-            async with httpx.AsyncClient(follow_redirects=True, timeout=30.0) as client:
-                response = await client.get(url)
-                response.raise_for_status()
-                
-                # Return component info with testing checklist summary
-                return [TextContent(
-                    type="text",
-                    text=f"""# Magenta A11y: {component.title()} Component
-
-**Category**: {comp_data['category']}
-**Description**: {comp_data['description']}
-**Source**: {url}
-
-## Testing Checklist
-
-Magenta A11y provides comprehensive testing checklists covering:
-
-### 1. Keyboard Testing
-- Tab navigation and focus order
-- Enter/Space activation
-- Arrow key navigation (where applicable)
-- Escape key to close/cancel
-- Focus visible indicator
-
-### 2. Screen Reader Testing
-- Proper role announcement
-- Label and state conveyed
-- Instructions provided
-- Error messages accessible
-- Focus management
+# (lowercased "name category description" haystack, formatted search result) per component
+_SEARCH_INDEX: list[tuple[str, str]] = [
+    (
+        f"{comp_name} {comp_data['category']} {comp_data['description']}".lower(),
+        f"**{comp_name.title()}** ({comp_data['category']}): {comp_data['description']}\n   → {comp_data['url']}",
+    )
+    for comp_name, comp_data in MAGENTA_COMPONENTS.items()
+]
 
-### 3. Visual Testing
-- Color contrast (4.5:1 minimum for normal text)
-- Focus indicator visible
-- Touch target size (minimum 44x44px)
-- Text spacing and readability
-- Error identification
-
-Visit {url} for complete testing procedures and code examples.
-
-Content preview:
-{response.text[:3000]}
-
-... (visit {url} for full checklist with examples)
-"""
-                )]
-        except Exception as e:
-            return [TextContent(
-                type="text",
-                text=f"Error fetching Magenta pattern for '{component}': {str(e)}\n\nDirect link: {url}"
-            )]
-    
-    elif name == "search_magenta_patterns":
-        query = arguments["query"].lower()
-        
-        # Search components by name, category, or description
-        matches = []
-        for comp_name, comp_data in MAGENTA_COMPONENTS.items():
-            if (query in comp_name.lower() or 
-                query in comp_data["category"].lower() or 
-                query in comp_data["description"].lower()):
-                matches.append(f"**{comp_name.title()}** ({comp_data['category']}): {comp_data['description']}\n   → {comp_data['url']}")
-        
-        if matches:
-            return [TextContent(
-                type="text",
-                text=f"# Magenta A11y Components matching '{query}':\n\n" + "\n\n".join(matches)
-            )]
-        else:
-            return [TextContent(
-                type="text",
-                text=f"No components found matching '{query}'.\n\nAvailable components: {', '.join(MAGENTA_COMPONENTS.keys())}\n\nBrowse all at: https://www.magentaa11y.com/"
-            )]
-    
-    elif name == "get_magenta_testing_methods":
-        method = arguments["method"]
-        
-        testing_info = {
-            "keyboard": """# Magenta A11y: Keyboard Testing Method
+# Testing method guides served verbatim by get_magenta_testing_methods
+_TESTING_INFO = MappingProxyType({
+    "keyboard": """# Magenta A11y: Keyboard Testing Method
 
 ## General Keyboard Testing Procedures:
 
@@ -267,7 +225,7 @@ Content preview:
 
 Reference: https://www.magentaa11y.com/
 """,
-            "screen-reader": """# Magenta A11y: Screen Reader Testing Method
+    "screen-reader": """# Magenta A11y: Screen Reader Testing Method
 
 ## General Screen Reader Testing:
 
@@ -303,7 +261,7 @@ Reference: https://www.magentaa11y.com/
 
 Reference: https://www.magentaa11y.com/
 """,
-            "visual": """# Magenta A11y: Visual Testing Method
+    "visual": """# Magenta A11y: Visual Testing Method
 
 ## General Visual Testing:
 
@@ -344,7 +302,7 @@ Reference: https://www.magentaa11y.com/
 
 Reference: https://www.magentaa11y.com/
 """,
-            "all": """# Magenta A11y: Complete Testing Methods
+    "all": """# Magenta A11y: Complete Testing Methods
 
 ## 1. Keyboard Testing
 - Tab navigation and focus order
@@ -374,11 +332,151 @@ Each Magenta A11y component checklist includes:
 
 Browse components: https://www.magentaa11y.com/
 """
+})
+
+# Built once at import; list_tools hands back the same list every call
+_TOOLS: list[Tool] = [
+    Tool(
+        name="get_magenta_component",
+        description="Get Magenta A11y testing checklist for a specific component (button, form, dialog, tabs, etc.)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "component": {
+                    "type": "string",
+                    "description": "Component name",
+                    "enum": list(MAGENTA_COMPONENTS.keys())
+                }
+            },
+            "required": ["component"]
+        }
+    ),
+    Tool(
+        name="search_magenta_patterns",
+        description="Search Magenta A11y for components matching a description or category",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Search query (e.g., 'forms', 'interactive', 'navigation')"
+                }
+            },
+            "required": ["query"]
+        }
+    ),
+    Tool(
+        name="get_magenta_testing_methods",
+        description="Get general testing methods from Magenta A11y (keyboard, screen reader, visual)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "method": {
+                    "type": "string",
+                    "description": "Testing method",
+                    "enum": ["keyboard", "screen-reader", "visual", "all"]
+                }
+            },
+            "required": ["method"]
         }
+    )
+]
+
+@app.list_tools()
+async def list_tools() -> list[Tool]:
+    """List available Magenta A11y tools"""
+    return _TOOLS
+
+@app.call_tool()
+async def call_tool(name: str, arguments: dict) -> list[TextContent]:
+    """Handle tool calls"""
+    
+    if name == "get_magenta_component":
+        component = arguments["component"]
+        
+        if component not in MAGENTA_COMPONENTS:
+            return [TextContent(
+                type="text",
+                text=f"Error: Unknown component '{component}'. Available: {', '.join(MAGENTA_COMPONENTS.keys())}"
+            )]
+        
+        comp_data = MAGENTA_COMPONENTS[component]
+        url = comp_data["url"]
+        
+        try:
+            preview = await fetch_checklist_preview(url)
+            
+            # Return component info with testing checklist summary
+            return [TextContent(
+                type="text",
+                text=f"""# Magenta A11y: {component.title()} Component
+
+**Category**: {comp_data['category']}
+**Description**: {comp_data['description']}
+**Source**: {url}
+
+## Testing Checklist
+
+Magenta A11y provides comprehensive testing checklists covering:
+
+### 1. Keyboard Testing
+- Tab navigation and focus order
+- Enter/Space activation
+- Arrow key navigation (where applicable)
+- Escape key to close/cancel
+- Focus visible indicator
+
+### 2. Screen Reader Testing
+- Proper role announcement
+- Label and state conveyed
+- Instructions provided
+- Error messages accessible
+- Focus management
+
+### 3. Visual Testing
+- Color contrast (4.5:1 minimum for normal text)
+- Focus indicator visible
+- Touch target size (minimum 44x44px)
+- Text spacing and readability
+- Error identification
+
+Visit {url} for complete testing procedures and code examples.
+
+Content preview:
+{preview}
+
+... (visit {url} for full checklist with examples)
+"""
+            )]
+        except Exception as e:
+            return [TextContent(
+                type="text",
+                text=f"Error fetching Magenta pattern for '{component}': {str(e)}\n\nDirect link: {url}"
+            )]
+    
+    elif name == "search_magenta_patterns":
+        query = arguments["query"].lower()
+        
+        # Search components by name, category, or description
+        matches = [result for haystack, result in _SEARCH_INDEX if query in haystack]
+        
+        if matches:
+            return [TextContent(
+                type="text",
+                text=f"# Magenta A11y Components matching '{query}':\n\n" + "\n\n".join(matches)
+            )]
+        else:
+            return [TextContent(
+                type="text",
+                text=f"No components found matching '{query}'.\n\nAvailable components: {', '.join(MAGENTA_COMPONENTS.keys())}\n\nBrowse all at: https://www.magentaa11y.com/"
+            )]
+    
+    elif name == "get_magenta_testing_methods":
+        method = arguments["method"]
         
         return [TextContent(
             type="text",
-            text=testing_info.get(method, f"Unknown testing method: {method}")
+            text=_TESTING_INFO.get(method, f"Unknown testing method: {method}")
         )]
     
     return [TextContent(
@@ -392,14 +490,38 @@ def main():
     from mcp.server.stdio import stdio_server
     
     async def run():
-        async with stdio_server() as (read_stream, write_stream):
-            await app.run(
-                read_stream,
-                write_stream,
-                app.create_initialization_options()
-            )
+        get_client()
+        loop = asyncio.get_running_loop()
+        task = asyncio.current_task()
+        closing: list[asyncio.Task] = []
+        
+        def on_sigterm() -> None:
+            # Supervisors stop the server with SIGTERM. stdio_server only
+            # unwinds once its blocking stdin read returns, so release the
+            # client's connections right away and then cancel the run
+            if _client is not None:
+                closing.append(loop.create_task(_client.aclose()))
+            task.cancel()
+        
+        with contextlib.suppress(NotImplementedError):
+            loop.add_signal_handler(signal.SIGTERM, on_sigterm)
+        try:
+            async with stdio_server() as (read_stream, write_stream):
+                await app.run(
+                    read_stream,
+                    write_stream,
+                    app.create_initialization_options()
+                )
+        except asyncio.CancelledError:
+            pass
+        finally:
+            if _client is not None:
+                await _client.aclose()
     
-    asyncio.run(run())
+    if uvloop is not None:
+        uvloop.run(run())
+    else:
+        asyncio.run(run())
 
 if __name__ == "__main__":
     main()
@@ -8,14 +8,19 @@ Allows AI agents to query database schema, tables, columns, and relationships.
 
 import asyncio
 import os
+import time
 from typing import Any
-import psycopg2
-import psycopg2.extras
+import asyncpg
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 from dotenv import load_dotenv
 
+try:
+    import uvloop
+except ImportError:  # optional speedup (not available on Windows), fall back to asyncio's loop
+    uvloop = None
+
 # Load environment variables
 load_dotenv()
 
@@ -29,115 +34,168 @@ DB_PASSWORD = os.getenv("SUPABASE_DB_PASSWORD", "postgres")
 # Create MCP server instance
 app = Server("supabase-schema-server")
 
+# Connection pool shared by all tool calls; created in main()
+_pool: asyncpg.Pool | None = None
+
+# Tool output keyed by (tool name, table name). The schema rarely changes
+# within a session; invalidate_schema_cache clears it after migrations.
+_SCHEMA_CACHE_TTL = 60.0
+_schema_cache: dict[tuple[str, str], tuple[float, str]] = {}
+
 
-def get_db_connection():
-    """Create a database connection."""
-    return psycopg2.connect(
+async def create_pool() -> asyncpg.Pool:
+    """Create the database connection pool."""
+    return await asyncpg.create_pool(
         host=DB_HOST,
         port=DB_PORT,
         database=DB_NAME,
         user=DB_USER,
         password=DB_PASSWORD,
-        cursor_factory=psycopg2.extras.RealDictCursor
+        min_size=2,
+        max_size=10,
+        statement_cache_size=1024,
     )
 
 
-@app.list_tools()
-async def list_tools() -> list[Tool]:
-    """List available MCP tools."""
-    return [
-        Tool(
-            name="list_tables",
-            description="List all tables in the public schema",
-            inputSchema={
-                "type": "object",
-                "properties": {},
+# Built once at import; list_tools hands back the same list every call
+_TOOLS: list[Tool] = [
+    Tool(
+        name="list_tables",
+        description="List all tables in the public schema",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+        },
+    ),
+    Tool(
+        name="get_table_schema",
+        description="Get detailed schema information for a specific table",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "table_name": {
+                    "type": "string",
+                    "description": "Name of the table to inspect",
+                }
             },
-        ),
-        Tool(
-            name="get_table_schema",
-            description="Get detailed schema information for a specific table",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "table_name": {
-                        "type": "string",
-                        "description": "Name of the table to inspect",
-                    }
-                },
-                "required": ["table_name"],
+            "required": ["table_name"],
+        },
+    ),
+    Tool(
+        name="get_table_relationships",
+        description="Get foreign key relationships for a table",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "table_name": {
+                    "type": "string",
+                    "description": "Name of the table",
+                }
             },
-        ),
-        Tool(
-            name="get_table_relationships",
-            description="Get foreign key relationships for a table",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "table_name": {
-                        "type": "string",
-                        "description": "Name of the table",
-                    }
-                },
-                "required": ["table_name"],
+            "required": ["table_name"],
+        },
+    ),
+    Tool(
+        name="get_table_indexes",
+        description="Get indexes for a specific table",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "table_name": {
+                    "type": "string",
+                    "description": "Name of the table",
+                }
             },
-        ),
-        Tool(
-            name="get_table_indexes",
-            description="Get indexes for a specific table",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "table_name": {
-                        "type": "string",
-                        "description": "Name of the table",
-                    }
-                },
-                "required": ["table_name"],
+            "required": ["table_name"],
+        },
+    ),
+    Tool(
+        name="get_rls_policies",
+        description="Get Row Level Security policies for a table",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "table_name": {
+                    "type": "string",
+                    "description": "Name of the table",
+                }
             },
+            "required": ["table_name"],
+        },
+    ),
+    Tool(
+        name="describe_table",
+        description=(
+            "Get a table's schema, relationships, indexes and RLS policies in one call "
+            "(preferred over calling the four tools individually)"
         ),
-        Tool(
-            name="get_rls_policies",
-            description="Get Row Level Security policies for a table",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "table_name": {
-                        "type": "string",
-                        "description": "Name of the table",
-                    }
-                },
-                "required": ["table_name"],
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "table_name": {
+                    "type": "string",
+                    "description": "Name of the table",
+                }
             },
-        ),
-    ]
+            "required": ["table_name"],
+        },
+    ),
+    Tool(
+        name="invalidate_schema_cache",
+        description="Clear cached schema results (e.g. after running a migration)",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+        },
+    ),
+]
+
+@app.list_tools()
+async def list_tools() -> list[Tool]:
+    """List available MCP tools."""
+    return _TOOLS
 
 
 @app.call_tool()
 async def call_tool(name: str, arguments: Any) -> list[TextContent]:
     """Handle tool calls."""
-    conn = get_db_connection()
-
-    try:
-        if name == "list_tables":
-            result = list_tables_impl(conn)
-        elif name == "get_table_schema":
-            result = get_table_schema_impl(conn, arguments["table_name"])
-        elif name == "get_table_relationships":
-            result = get_table_relationships_impl(conn, arguments["table_name"])
-        elif name == "get_table_indexes":
-            result = get_table_indexes_impl(conn, arguments["table_name"])
-        elif name == "get_rls_policies":
-            result = get_rls_policies_impl(conn, arguments["table_name"])
-        else:
-            result = f"Unknown tool: {name}"
-
-        return [TextContent(type="text", text=result)]
-    finally:
-        conn.close()
-
-
-def list_tables_impl(conn) -> str:
+    global _pool
+
+    if name == "invalidate_schema_cache":
+        cleared = len(_schema_cache)
+        _schema_cache.clear()
+        return [TextContent(type="text", text=f"Schema cache cleared ({cleared} entries).")]
+
+    key = (name, (arguments or {}).get("table_name", ""))
+    cached = _schema_cache.get(key)
+    if cached is not None and time.monotonic() - cached[0] < _SCHEMA_CACHE_TTL:
+        return [TextContent(type="text", text=cached[1])]
+
+    if _pool is None:
+        _pool = await create_pool()
+
+    if name == "describe_table":
+        result = await describe_table_impl(_pool, arguments["table_name"])
+    else:
+        async with _pool.acquire() as conn:
+            if name == "list_tables":
+                result = await list_tables_impl(conn)
+            elif name == "get_table_schema":
+                result = await get_table_schema_impl(conn, arguments["table_name"])
+            elif name == "get_table_relationships":
+                result = await get_table_relationships_impl(conn, arguments["table_name"])
+            elif name == "get_table_indexes":
+                result = await get_table_indexes_impl(conn, arguments["table_name"])
+            elif name == "get_rls_policies":
+                result = await get_rls_policies_impl(conn, arguments["table_name"])
+            else:
+                return [TextContent(type="text", text=f"Unknown tool: {name}")]
+
+    _schema_cache[key] = (time.monotonic(), result)
+    return [TextContent(type="text", text=result)]
+
+
+async def list_tables_impl(conn: asyncpg.Connection) -> str:
     """List all tables in the public schema."""
     query = """
         SELECT 
@@ -148,24 +206,21 @@ def list_tables_impl(conn) -> str:
         AND table_type = 'BASE TABLE'
         ORDER BY table_name;
     """
-    cur = conn.cursor()
-    cur.execute(query)
-    rows = cur.fetchall()
-    cur.close()
+    rows = await conn.fetch(query)
 
     if not rows:
         return "No tables found in public schema."
 
-    result = "Tables in public schema:\n\n"
+    parts = ["Tables in public schema:\n\n"]
     for row in rows:
         table_name = row["table_name"]
         description = row["description"] or "No description"
-        result += f"- {table_name}: {description}\n"
+        parts.append(f"- {table_name}: {description}\n")
 
-    return result
+    return "".join(parts)
 
 
-def get_table_schema_impl(conn, table_name: str) -> str:
+async def get_table_schema_impl(conn: asyncpg.Connection, table_name: str) -> str:
     """Get detailed schema for a table."""
     query = """
         SELECT 
@@ -174,23 +229,22 @@ def get_table_schema_impl(conn, table_name: str) -> str:
             is_nullable,
             column_default,
             character_maximum_length,
-            col_description(('public.' || %s)::regclass, ordinal_position) as column_description
+            col_description(('public.' || $1::text)::regclass, ordinal_position) as column_description
         FROM information_schema.columns
         WHERE table_schema = 'public'
-        AND table_name = %s
+        AND table_name = $1::text
         ORDER BY ordinal_position;
     """
-    cur = conn.cursor()
-    cur.execute(query, (table_name, table_name))
-    rows = cur.fetchall()
-    cur.close()
+    rows = await conn.fetch(query, table_name)
 
     if not rows:
         return f"Table '{table_name}' not found."
 
-    result = f"Schema for table '{table_name}':\n\n"
-    result += "Column Name | Type | Nullable | Default | Description\n"
-    result += "----------- | ---- | -------- | ------- | -----------\n"
+    parts = [
+        f"Schema for table '{table_name}':\n\n"
+        "Column Name | Type | Nullable | Default | Description\n"
+        "----------- | ---- | -------- | ------- | -----------\n"
+    ]
 
     for row in rows:
         col_name = row["column_name"]
@@ -201,9 +255,12 @@ def get_table_schema_impl(conn, table_name: str) -> str:
         default = row["column_default"] or "-"
         description = row["column_description"] or "-"
 
-        result += f"{col_name} | {data_type} | {nullable} | {default} | {description}\n"
+        parts.append(f"{col_name} | {data_type} | {nullable} | {default} | {description}\n")
+
+    return "".join(parts)
 
-def get_table_relationships_impl(conn, table_name: str) -> str:
+
+async def get_table_relationships_impl(conn: asyncpg.Connection, table_name: str) -> str:
     """Get foreign key relationships for a table."""
     query = """
         SELECT
@@ -225,12 +282,6 @@ def get_table_relationships_impl(conn, table_name: str) -> str:
             AND rc.constraint_schema = tc.table_schema
         WHERE tc.constraint_type = 'FOREIGN KEY'
         AND tc.table_schema = 'public'
-        AND tc.table_name = %s;
-    """
-    cur = conn.cursor()
-    cur.execute(query, (table_name,))
-    rows = cur.fetchall()
-    cur.close(
         AND tc.table_name = $1;
     """
     rows = await conn.fetch(query, table_name)
@@ -238,15 +289,16 @@ def get_table_relationships_impl(conn, table_name: str) -> str:
     if not rows:
         return f"No foreign key relationships found for table '{table_name}'."
 
-    result = f"Foreign key relationships for '{table_name}':\n\n"
+    parts = [f"Foreign key relationships for '{table_name}':\n\n"]
 
     for row in rows:
-        result += f"- {row['column_name']} → {row['foreign_table_name']}.{row['foreign_column_name']}\n"
-        result += f"  ON DELETE: {row['delete_rule']}, ON UPDATE: {row['update_rule']}\n\n"
+        parts.append(f"- {row['column_name']} → {row['foreign_table_name']}.{row['foreign_column_name']}\n")
+        parts.append(f"  ON DELETE: {row['delete_rule']}, ON UPDATE: {row['update_rule']}\n\n")
+
+    return "".join(parts)
 
-    return result
 
-def get_table_indexes_impl(conn, table_name: str) -> str:
+async def get_table_indexes_impl(conn: asyncpg.Connection, table_name: str) -> str:
     """Get indexes for a table."""
     query = """
         SELECT
@@ -254,93 +306,112 @@ def get_table_indexes_impl(conn, table_name: str) -> str:
             indexdef
         FROM pg_indexes
         WHERE schemaname = 'public'
-        AND tablename = %s
+        AND tablename = $1
         ORDER BY indexname;
     """
-    cur = conn.cursor()
-    cur.execute(query, (table_name,))
-    rows = cur.fetchall()
-    cur.close(
     rows = await conn.fetch(query, table_name)
 
     if not rows:
         return f"No indexes found for table '{table_name}'."
 
-    result = f"Indexes for table '{table_name}':\n\n"
+    parts = [f"Indexes for table '{table_name}':\n\n"]
 
     for row in rows:
-        result += f"Index: {row['indexname']}\n"
-        result += f"Definition: {row['indexdef']}\n\n"
+        parts.append(f"Index: {row['indexname']}\n")
+        parts.append(f"Definition: {row['indexdef']}\n\n")
 
-def get_rls_policies_impl(conn, table_name: str) -> str:
+    return "".join(parts)
+
+
+async def get_rls_policies_impl(conn: asyncpg.Connection, table_name: str) -> str:
     """Get RLS policies for a table."""
-    # Check if RLS is enabled
-    rls_query = """
-        SELECT relrowsecurity
-        FROM pg_class
-        WHERE relname = %s AND relnamespace = 'public'::regnamespace;
+    # One round trip: the pg_class row says whether RLS is enabled and the
+    # left join adds one row per policy (a single NULL-policy row if none)
+    query = """
+        WITH rls AS (
+            SELECT relrowsecurity
+            FROM pg_class
+            WHERE relname = $1 AND relnamespace = 'public'::regnamespace
+        )
+        SELECT
+            rls.relrowsecurity,
+            p.policyname,
+            p.permissive,
+            p.roles,
+            p.cmd,
+            p.qual,
+            p.with_check
+        FROM rls
+        LEFT JOIN pg_policies p
+            ON p.schemaname = 'public'
+            AND p.tablename = $1
+        ORDER BY p.policyname;
     """
-    cur = conn.cursor()
-    cur.execute(rls_query, (table_name,))
-    rls_row = cur.fetchone()
+    rows = await conn.fetch(query, table_name)
 
-    if not rls_row:
-        cur.close()
+    if not rows:
         return f"Table '{table_name}' not found."
 
-    rls_enabled = rls_row["relrowsecurity"]
-
-    # Get policies
-    policies_query = """
-        SELECT
-            schemaname,
-            tablename,
-            policyname,
-            permissive,
-            roles,
-            cmd,
-            qual,
-            with_check
-        FROM pg_policies
-        WHERE schemaname = 'public'
-        AND tablename = %s
-        ORDER BY policyname;
-    """
-    cur.execute(policies_query, (table_name,))
-    rows = cur.fetchall()
-    cur.close(
-        ORDER BY policyname;
-    """
-    rows = await conn.fetch(policies_query, table_name)
+    rls_enabled = rows[0]["relrowsecurity"]
+    rows = [row for row in rows if row["policyname"] is not None]
 
-    result = f"Row Level Security for table '{table_name}':\n\n"
-    result += f"RLS Enabled: {'YES' if rls_enabled else 'NO'}\n\n"
+    parts = [
+        f"Row Level Security for table '{table_name}':\n\n",
+        f"RLS Enabled: {'YES' if rls_enabled else 'NO'}\n\n",
+    ]
 
     if not rows:
-        result += "No RLS policies found.\n"
-        return result
+        parts.append("No RLS policies found.\n")
+        return "".join(parts)
 
-    result += "Policies:\n\n"
+    parts.append("Policies:\n\n")
 
     for row in rows:
-        result += f"Policy: {row['policyname']}\n"
-        result += f"  Command: {row['cmd']}\n"
-        result += f"  Permissive: {row['permissive']}\n"
-        result += f"  Roles: {', '.join(row['roles'])}\n"
+        parts.append(f"Policy: {row['policyname']}\n")
+        parts.append(f"  Command: {row['cmd']}\n")
+        parts.append(f"  Permissive: {row['permissive']}\n")
+        parts.append(f"  Roles: {', '.join(row['roles'])}\n")
         if row["qual"]:
-            result += f"  USING: {row['qual']}\n"
+            parts.append(f"  USING: {row['qual']}\n")
         if row["with_check"]:
-            result += f"  WITH CHECK: {row['with_check']}\n"
-        result += "\n"
+            parts.append(f"  WITH CHECK: {row['with_check']}\n")
+        parts.append("\n")
+
+    return "".join(parts)
 
-    return result
+
+async def describe_table_impl(pool: asyncpg.Pool, table_name: str) -> str:
+    """Get schema, relationships, indexes and RLS policies for a table.
+
+    The four lookups are independent, so each runs on its own pooled
+    connection and the sections are joined in the usual tool order.
+    """
+    async def section(impl) -> str:
+        async with pool.acquire() as conn:
+            return await impl(conn, table_name)
+
+    sections = await asyncio.gather(
+        section(get_table_schema_impl),
+        section(get_table_relationships_impl),
+        section(get_table_indexes_impl),
+        section(get_rls_policies_impl),
+    )
+    return "\n\n".join(text.rstrip("\n") for text in sections) + "\n"
 
 
 async def main():
     """Run the MCP server."""
-    async with stdio_server() as (read_stream, write_stream):
-        await app.run(read_stream, write_stream, app.create_initialization_options())
+    global _pool
+    _pool = await create_pool()
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await app.run(read_stream, write_stream, app.create_initialization_options())
+    finally:
+        await _pool.close()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
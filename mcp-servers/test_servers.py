@@ -4,17 +4,29 @@ Quick test script to validate MCP servers are working correctly.
 This tests each server can start up and respond to basic tool calls.
 """
 import asyncio
+import importlib.util
 import json
 from pathlib import Path
 
+def _import_server(directory):
+    """Load <directory>/server.py under its own module name.
+
+    Each server lives in a module called "server", so importing them via
+    sys.path would hand every test the first one loaded.
+    """
+    path = Path(__file__).parent / directory / "server.py"
+    spec = importlib.util.spec_from_file_location(f"{directory.replace('-', '_')}_server", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
 async def test_wcag_docs_server():
     """Test WCAG docs server can return criterion details"""
     print("\n🧪 Testing WCAG Docs Server...")
     try:
-        # Import the server module
-        import sys
-        sys.path.insert(0, str(Path(__file__).parent / "wcag-docs-server"))
-        from server import WCAG_CRITERIA, get_wcag_criterion
+        # Import off the event loop so the concurrent tests overlap
+        server = await asyncio.to_thread(_import_server, "wcag-docs-server")
+        WCAG_CRITERIA, get_wcag_criterion = server.WCAG_CRITERIA, server.get_wcag_criterion
         
         # Test get criterion
         result = await get_wcag_criterion("1.1.1")
@@ -36,9 +48,8 @@ async def test_fetch_server():
     """Test fetch server can make HTTP requests"""
     print("\n🧪 Testing Fetch Server...")
     try:
-        import sys
-        sys.path.insert(0, str(Path(__file__).parent / "fetch-server"))
-        from server import fetch_url_metadata
+        server = await asyncio.to_thread(_import_server, "fetch-server")
+        fetch_url_metadata = server.fetch_url_metadata
         
         # Test fetching metadata from a known reliable site
         result = await fetch_url_metadata("https://www.w3.org/WAI/WCAG22/quickref/")
@@ -56,9 +67,8 @@ async def test_axe_server():
     """Test axe-core server can analyze HTML"""
     print("\n🧪 Testing Axe-Core Server...")
     try:
-        import sys
-        sys.path.insert(0, str(Path(__file__).parent / "axe-core-server"))
-        from server import analyze_html
+        server = await asyncio.to_thread(_import_server, "axe-core-server")
+        analyze_html = server.analyze_html
         
         # Test with simple HTML that has accessibility issues
         test_html = """
@@ -91,12 +101,18 @@ async def main():
     print("MCP Server Test Suite")
     print("=" * 60)
     
-    results = []
-    
-    # Test each server
-    results.append(("WCAG Docs", await test_wcag_docs_server()))
-    results.append(("Fetch", await test_fetch_server()))
-    results.append(("Axe-Core", await test_axe_server()))
+    # The server tests are independent, so run them concurrently
+    names = ["WCAG Docs", "Fetch", "Axe-Core"]
+    outcomes = await asyncio.gather(
+        test_wcag_docs_server(),
+        test_fetch_server(),
+        test_axe_server(),
+        return_exceptions=True,
+    )
+    results = [
+        (name, outcome is True)
+        for name, outcome in zip(names, outcomes)
+    ]
     
     # Summary
     print("\n" + "=" * 60)
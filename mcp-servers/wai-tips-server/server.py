@@ -5,14 +5,91 @@ Provides tools for accessing WAI developing, designing, and writing tips
 """
 
 import asyncio
+import os
+import re
+import time
+from types import MappingProxyType
 import httpx
+from selectolax.lexbor import LexborHTMLParser
 from mcp.server import Server
 from mcp.types import Tool, TextContent
 
+try:
+    import uvloop
+except ImportError:  # optional speedup (not available on Windows), fall back to asyncio's loop
+    uvloop = None
+
 app = Server("ally-checker-wai-tips")
 
-# W3C WAI Resources
-WAI_RESOURCES = {
+# One pooled client for the server's lifetime so repeated w3.org fetches reuse
+# connections (multiplexed over HTTP/2) instead of a handshake per call
+_client: httpx.AsyncClient | None = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=True,
+            follow_redirects=True,
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=40, max_keepalive_connections=20),
+        )
+    return _client
+
+
+# Page excerpts keyed by full URL: (fetched_at, excerpt). WAI pages change on
+# the order of weeks, so repeat lookups within the TTL skip the network. The
+# size cap bounds memory since specific_page lets callers vary the URL.
+_FETCH_CACHE: dict[str, tuple[float, str]] = {}
+_FETCH_CACHE_TTL = 3600.0
+_FETCH_CACHE_MAX_ENTRIES = 64
+_EXCERPT_CHARS = 5000
+# Stop downloading once </main> has arrived or the page passes this size
+_MAX_PAGE_BYTES = 200_000
+# Caps concurrent w3.org downloads when a caller fires many lookups at once
+_HTTP_SEM = asyncio.Semaphore(8)
+
+
+def extract_main_text(html: bytes) -> str:
+    """Return the readable text of a page's <main> (or <article>/<body>)."""
+    tree = LexborHTMLParser(html)
+    tree.strip_tags(["script", "style", "noscript"])
+    node = tree.css_first("main") or tree.css_first("article") or tree.body
+    if node is None:
+        return ""
+    return node.text(separator=" ", strip=True)
+
+
+async def fetch_page_excerpt(url: str) -> str:
+    """Fetch the start of a WAI page, serving recent copies from the cache."""
+    cached = _FETCH_CACHE.get(url)
+    now = time.monotonic()
+    if cached is not None and now - cached[0] < _FETCH_CACHE_TTL:
+        return cached[1]
+    
+    body = bytearray()
+    async with _HTTP_SEM, get_client().stream("GET", url) as response:
+        response.raise_for_status()
+        async for chunk in response.aiter_bytes():
+            # Only the new bytes (plus overlap) can complete the closing tag
+            search_from = max(0, len(body) - len(b"</main>"))
+            body += chunk
+            if body.find(b"</main>", search_from) != -1 or len(body) > _MAX_PAGE_BYTES:
+                break
+    excerpt = extract_main_text(bytes(body))[:_EXCERPT_CHARS]
+    
+    # Re-insert so dict order tracks age and the oldest entry is evicted first
+    _FETCH_CACHE.pop(url, None)
+    _FETCH_CACHE[url] = (now, excerpt)
+    if len(_FETCH_CACHE) > _FETCH_CACHE_MAX_ENTRIES:
+        del _FETCH_CACHE[next(iter(_FETCH_CACHE))]
+    return excerpt
+
+
+# W3C WAI Resources (read-only; shared by every tool call)
+WAI_RESOURCES = MappingProxyType({
     "developing": {
         "url": "https://www.w3.org/WAI/tips/developing/",
         "title": "Developing for Web Accessibility",
@@ -48,60 +125,177 @@ WAI_RESOURCES = {
         "title": "ARIA Authoring Practices Guide (APG)",
         "description": "WAI-ARIA patterns and widgets"
     }
-}
+})
+_WAI_RESOURCES_AVAILABLE = ", ".join(WAI_RESOURCES)
 
-@app.list_tools()
-async def list_tools() -> list[Tool]:
-    """List available WAI tips tools"""
-    return [
-        Tool(
-            name="get_wai_resource",
-            description="Get W3C WAI resource content (developing tips, designing tips, writing tips, ARIA patterns, Understanding docs)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "resource": {
-                        "type": "string",
-                        "description": "Resource to fetch",
-                        "enum": ["developing", "designing", "writing", "main", "understanding", "understanding22", "aria"]
-                    },
-                    "specific_page": {
-                        "type": "string",
-                        "description": "Optional specific page URL path (e.g., 'headings-and-labels.html' for Understanding docs)"
-                    }
-                },
-                "required": ["resource"]
-            }
+# Topic keywords and the tips they select, in output order. A keyword
+# matches when it appears anywhere in the topic ("headings" hits "heading").
+_TIP_GROUPS: tuple[tuple[tuple[str, ...], tuple[str, ...]], ...] = (
+    (
+        ("heading", "label", "title"),
+        (
+            "**Developing Tip**: Provide informative, unique page titles and use headings to convey meaning and structure",
+            "**Understanding WCAG 2.4.6 (Headings and Labels)**: https://www.w3.org/WAI/WCAG21/Understanding/headings-and-labels.html",
         ),
-        Tool(
-            name="search_wai_tips",
-            description="Search for WAI tips related to a specific accessibility concern (headings, forms, images, colors, etc.)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "topic": {
-                        "type": "string",
-                        "description": "Topic to search for (e.g., 'headings', 'forms', 'images', 'color contrast', 'keyboard navigation')"
-                    }
-                },
-                "required": ["topic"]
-            }
+    ),
+    (
+        ("form", "input", "label"),
+        (
+            "**Developing Tip**: Associate a label with every form control",
+            "**Designing Tip**: Provide clear and consistent navigation options",
+        ),
+    ),
+    (
+        ("image", "alt", "alternative"),
+        (
+            "**Developing Tip**: Provide text alternatives for images",
+            "**Writing Tip**: Write meaningful text alternatives for images",
         ),
-        Tool(
-            name="get_aria_pattern",
-            description="Get WAI-ARIA pattern documentation for interactive components",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "pattern": {
-                        "type": "string",
-                        "description": "ARIA pattern name (e.g., 'dialog', 'tabs', 'accordion', 'menu', 'button', 'combobox')"
-                    }
+    ),
+    (
+        ("color", "contrast"),
+        (
+            "**Designing Tip**: Provide sufficient contrast between foreground and background",
+            "**Designing Tip**: Don't use color alone to convey information",
+        ),
+    ),
+    (
+        ("keyboard", "navigation", "focus"),
+        (
+            "**Developing Tip**: Ensure that all interactive elements are keyboard accessible",
+            "**Developing Tip**: Provide a skip link and ensure keyboard focus is visible and clear",
+        ),
+    ),
+    (
+        ("aria", "role", "state"),
+        (
+            "**ARIA Patterns**: Use WAI-ARIA roles, states, and properties correctly",
+            "**Reference**: https://www.w3.org/WAI/ARIA/apg/",
+        ),
+    ),
+)
+
+# keyword -> bitmask of its _TIP_GROUPS indexes ("label" sets two bits)
+_KEYWORD_BITS: dict[str, int] = {}
+for _group, (_keywords, _tips) in enumerate(_TIP_GROUPS):
+    for _keyword in _keywords:
+        _KEYWORD_BITS[_keyword] = _KEYWORD_BITS.get(_keyword, 0) | 1 << _group
+del _group, _keywords, _tips, _keyword
+
+# A keyword also selects the groups of any keyword it starts with, since the
+# pattern below reports only the longest keyword at each position
+# ("alternative" hides "alt" there)
+for _keyword in _KEYWORD_BITS:
+    for _prefix, _bits in _KEYWORD_BITS.items():
+        if _keyword.startswith(_prefix):
+            _KEYWORD_BITS[_keyword] |= _bits
+del _keyword, _prefix, _bits
+
+# (bit, tips) per group in output order
+_TIPS_BY_BIT: tuple[tuple[int, tuple[str, ...]], ...] = tuple(
+    (1 << group, tips) for group, (_, tips) in enumerate(_TIP_GROUPS)
+)
+
+# Finds every keyword in one scan of the topic. The lookahead matches at
+# each position without consuming, so overlapping keywords are all seen;
+# longer keywords come first so the one reported at a position is the
+# longest there, and its bits already cover the shorter ones.
+_KEYWORD_PATTERN = re.compile(
+    "(?=("
+    + "|".join(re.escape(keyword) for keyword in sorted(_KEYWORD_BITS, key=len, reverse=True))
+    + "))"
+)
+
+async def warm_cache() -> None:
+    """Prefetch every WAI resource page so first lookups are served from the cache."""
+    semaphore = asyncio.Semaphore(5)
+    
+    async def prefetch(url: str) -> None:
+        async with semaphore:
+            await fetch_page_excerpt(url)
+    
+    await asyncio.gather(
+        *(prefetch(resource["url"]) for resource in WAI_RESOURCES.values()),
+        return_exceptions=True,
+    )
+
+# Common pattern names mapped to their APG pages
+_ARIA_PATTERNS = MappingProxyType({
+    "dialog": "https://www.w3.org/WAI/ARIA/apg/patterns/dialog-modal/",
+    "modal": "https://www.w3.org/WAI/ARIA/apg/patterns/dialog-modal/",
+    "tabs": "https://www.w3.org/WAI/ARIA/apg/patterns/tabs/",
+    "accordion": "https://www.w3.org/WAI/ARIA/apg/patterns/accordion/",
+    "menu": "https://www.w3.org/WAI/ARIA/apg/patterns/menubar/",
+    "button": "https://www.w3.org/WAI/ARIA/apg/patterns/button/",
+    "combobox": "https://www.w3.org/WAI/ARIA/apg/patterns/combobox/",
+    "disclosure": "https://www.w3.org/WAI/ARIA/apg/patterns/disclosure/",
+    "listbox": "https://www.w3.org/WAI/ARIA/apg/patterns/listbox/",
+    "tooltip": "https://www.w3.org/WAI/ARIA/apg/patterns/tooltip/",
+    "breadcrumb": "https://www.w3.org/WAI/ARIA/apg/patterns/breadcrumb/",
+    "carousel": "https://www.w3.org/WAI/ARIA/apg/patterns/carousel/",
+    "feed": "https://www.w3.org/WAI/ARIA/apg/patterns/feed/",
+    "table": "https://www.w3.org/WAI/ARIA/apg/patterns/table/",
+    "grid": "https://www.w3.org/WAI/ARIA/apg/patterns/grid/",
+    "treegrid": "https://www.w3.org/WAI/ARIA/apg/patterns/treegrid/",
+    "tree": "https://www.w3.org/WAI/ARIA/apg/patterns/treeview/"
+})
+_ARIA_PATTERNS_AVAILABLE = ", ".join(_ARIA_PATTERNS)
+
+# Built once at import; list_tools hands back the same list every call
+_TOOLS: list[Tool] = [
+    Tool(
+        name="get_wai_resource",
+        description="Get W3C WAI resource content (developing tips, designing tips, writing tips, ARIA patterns, Understanding docs)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "resource": {
+                    "type": "string",
+                    "description": "Resource to fetch",
+                    "enum": ["developing", "designing", "writing", "main", "understanding", "understanding22", "aria"]
                 },
-                "required": ["pattern"]
-            }
-        )
-    ]
+                "specific_page": {
+                    "type": "string",
+                    "description": "Optional specific page URL path (e.g., 'headings-and-labels.html' for Understanding docs)"
+                }
+            },
+            "required": ["resource"]
+        }
+    ),
+    Tool(
+        name="search_wai_tips",
+        description="Search for WAI tips related to a specific accessibility concern (headings, forms, images, colors, etc.)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "topic": {
+                    "type": "string",
+                    "description": "Topic to search for (e.g., 'headings', 'forms', 'images', 'color contrast', 'keyboard navigation')"
+                }
+            },
+            "required": ["topic"]
+        }
+    ),
+    Tool(
+        name="get_aria_pattern",
+        description="Get WAI-ARIA pattern documentation for interactive components",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "pattern": {
+                    "type": "string",
+                    "description": "ARIA pattern name (e.g., 'dialog', 'tabs', 'accordion', 'menu', 'button', 'combobox')"
+                }
+            },
+            "required": ["pattern"]
+        }
+    )
+]
+
+@app.list_tools()
+async def list_tools() -> list[Tool]:
+    """List available WAI tips tools"""
+    return _TOOLS
 
 @app.call_tool()
 async def call_tool(name: str, arguments: dict) -> list[TextContent]:
@@ -114,7 +308,7 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
         if resource not in WAI_RESOURCES:
             return [TextContent(
                 type="text",
-                text=f"Error: Unknown resource '{resource}'. Available: {', '.join(WAI_RESOURCES.keys())}"
+                text=f"Error: Unknown resource '{resource}'. Available: {_WAI_RESOURCES_AVAILABLE}"
             )]
         
         url = WAI_RESOURCES[resource]["url"]
@@ -122,22 +316,17 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
             url = url.rstrip('/') + '/' + specific_page.lstrip('/')
         
         try:
-            async with httpx.AsyncClient(follow_redirects=True, timeout=30.0) as client:
-                response = await client.get(url)
-                response.raise_for_status()
-                
-                # Extract main content (simplified - in production, parse HTML properly)
-                html = response.text
-                
-                # Basic content extraction
-                title = WAI_RESOURCES[resource]["title"]
-                if specific_page:
-                    title = f"{title} - {specific_page}"
-                
-                return [TextContent(
-                    type="text",
-                    text=f"# {title}\n\nSource: {url}\n\n{html[:5000]}\n\n... (content truncated, visit {url} for full content)"
-                )]
+            # Main page content as plain text
+            html = await fetch_page_excerpt(url)
+            
+            title = WAI_RESOURCES[resource]["title"]
+            if specific_page:
+                title = f"{title} - {specific_page}"
+            
+            return [TextContent(
+                type="text",
+                text=f"# {title}\n\nSource: {url}\n\n{html}\n\n... (content truncated, visit {url} for full content)"
+            )]
         except Exception as e:
             return [TextContent(
                 type="text",
@@ -147,32 +336,12 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
     elif name == "search_wai_tips":
         topic = arguments["topic"].lower()
         
-        # Map topics to relevant WAI resources
-        tips = []
-        
-        if any(word in topic for word in ["heading", "label", "title"]):
-            tips.append("**Developing Tip**: Provide informative, unique page titles and use headings to convey meaning and structure")
-            tips.append("**Understanding WCAG 2.4.6 (Headings and Labels)**: https://www.w3.org/WAI/WCAG21/Understanding/headings-and-labels.html")
-        
-        if any(word in topic for word in ["form", "input", "label"]):
-            tips.append("**Developing Tip**: Associate a label with every form control")
-            tips.append("**Designing Tip**: Provide clear and consistent navigation options")
-        
-        if any(word in topic for word in ["image", "alt", "alternative"]):
-            tips.append("**Developing Tip**: Provide text alternatives for images")
-            tips.append("**Writing Tip**: Write meaningful text alternatives for images")
-        
-        if any(word in topic for word in ["color", "contrast"]):
-            tips.append("**Designing Tip**: Provide sufficient contrast between foreground and background")
-            tips.append("**Designing Tip**: Don't use color alone to convey information")
-        
-        if any(word in topic for word in ["keyboard", "navigation", "focus"]):
-            tips.append("**Developing Tip**: Ensure that all interactive elements are keyboard accessible")
-            tips.append("**Developing Tip**: Provide a skip link and ensure keyboard focus is visible and clear")
-        
-        if any(word in topic for word in ["aria", "role", "state"]):
-            tips.append("**ARIA Patterns**: Use WAI-ARIA roles, states, and properties correctly")
-            tips.append("**Reference**: https://www.w3.org/WAI/ARIA/apg/")
+        # Every keyword found in the topic sets its groups' bits; emit the
+        # selected groups in their canonical order so output is stable
+        mask = 0
+        for match in _KEYWORD_PATTERN.finditer(topic):
+            mask |= _KEYWORD_BITS[match.group(1)]
+        tips = [tip for bit, group_tips in _TIPS_BY_BIT if mask & bit for tip in group_tips]
         
         if not tips:
             tips.append(f"No specific tips found for '{topic}'. Try: headings, forms, images, color, keyboard, aria")
@@ -186,49 +355,25 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
     elif name == "get_aria_pattern":
         pattern = arguments["pattern"].lower()
         
-        # Map common patterns to APG URLs
-        aria_patterns = {
-            "dialog": "https://www.w3.org/WAI/ARIA/apg/patterns/dialog-modal/",
-            "modal": "https://www.w3.org/WAI/ARIA/apg/patterns/dialog-modal/",
-            "tabs": "https://www.w3.org/WAI/ARIA/apg/patterns/tabs/",
-            "accordion": "https://www.w3.org/WAI/ARIA/apg/patterns/accordion/",
-            "menu": "https://www.w3.org/WAI/ARIA/apg/patterns/menubar/",
-            "button": "https://www.w3.org/WAI/ARIA/apg/patterns/button/",
-            "combobox": "https://www.w3.org/WAI/ARIA/apg/patterns/combobox/",
-            "disclosure": "https://www.w3.org/WAI/ARIA/apg/patterns/disclosure/",
-            "listbox": "https://www.w3.org/WAI/ARIA/apg/patterns/listbox/",
-            "tooltip": "https://www.w3.org/WAI/ARIA/apg/patterns/tooltip/",
-            "breadcrumb": "https://www.w3.org/WAI/ARIA/apg/patterns/breadcrumb/",
-            "carousel": "https://www.w3.org/WAI/ARIA/apg/patterns/carousel/",
-            "feed": "https://www.w3.org/WAI/ARIA/apg/patterns/feed/",
-            "table": "https://www.w3.org/WAI/ARIA/apg/patterns/table/",
-            "grid": "https://www.w3.org/WAI/ARIA/apg/patterns/grid/",
-            "treegrid": "https://www.w3.org/WAI/ARIA/apg/patterns/treegrid/",
-            "tree": "https://www.w3.org/WAI/ARIA/apg/patterns/treeview/"
-        }
-        
-        if pattern in aria_patterns:
-            url = aria_patterns[pattern]
+        if pattern in _ARIA_PATTERNS:
+            url = _ARIA_PATTERNS[pattern]
             
             try:
-                async with httpx.AsyncClient(follow_redirects=True, timeout=30.0) as client:
-                    response = await client.get(url)
-                    response.raise_for_status()
-                    
-                    return [TextContent(
-                        type="text",
-                        text=f"# WAI-ARIA {pattern.title()} Pattern\n\nSource: {url}\n\n{response.text[:5000]}\n\n... (visit {url} for full pattern with examples)"
-                    )]
+                excerpt = await fetch_page_excerpt(url)
+                
+                return [TextContent(
+                    type="text",
+                    text=f"# WAI-ARIA {pattern.title()} Pattern\n\nSource: {url}\n\n{excerpt}\n\n... (visit {url} for full pattern with examples)"
+                )]
             except Exception as e:
                 return [TextContent(
                     type="text",
                     text=f"Error fetching ARIA pattern for '{pattern}': {str(e)}\n\nDirect link: {url}"
                 )]
         else:
-            available = ", ".join(aria_patterns.keys())
             return [TextContent(
                 type="text",
-                text=f"Pattern '{pattern}' not found. Available patterns: {available}\n\nBrowse all patterns at: https://www.w3.org/WAI/ARIA/apg/patterns/"
+                text=f"Pattern '{pattern}' not found. Available patterns: {_ARIA_PATTERNS_AVAILABLE}\n\nBrowse all patterns at: https://www.w3.org/WAI/ARIA/apg/patterns/"
             )]
     
     return [TextContent(
@@ -238,18 +383,29 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
 
 def main():
     """Run the server using stdin/stdout streams"""
-    import sys
     from mcp.server.stdio import stdio_server
     
     async def run():
-        async with stdio_server() as (read_stream, write_stream):
-            await app.run(
-                read_stream,
-                write_stream,
-                app.create_initialization_options()
-            )
+        get_client()
+        # Opt-in: warm the page cache in the background while serving
+        warmup = asyncio.create_task(warm_cache()) if os.getenv("WAI_WARMUP") == "1" else None
+        try:
+            async with stdio_server() as (read_stream, write_stream):
+                await app.run(
+                    read_stream,
+                    write_stream,
+                    app.create_initialization_options()
+                )
+        finally:
+            if warmup is not None:
+                warmup.cancel()
+            if _client is not None:
+                await _client.aclose()
     
-    asyncio.run(run())
+    if uvloop is not None:
+        uvloop.run(run())
+    else:
+        asyncio.run(run())
 
 if __name__ == "__main__":
     main()
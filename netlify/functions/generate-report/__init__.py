@@ -13,6 +13,15 @@ Uses:
 - Jinja2 for HTML templates
 """
 
-from .main import handler
-
 __all__ = ["handler"]
+
+
+def __getattr__(name):
+    # Import lazily so loading the package doesn't pull in python-docx,
+    # PydanticAI and Jinja2 until the handler is first used
+    if name == "handler":
+        from .main import handler
+
+        globals()["handler"] = handler
+        return handler
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,12 +3,19 @@
 Standalone Python script for report generation.
 Called by Node.js Netlify function.
 Reads JSON from REQUEST_BODY env var, writes binary to stdout.
+
+Exit status 0: stdout holds the complete report.
+Exit status 1: generation failed and a JSON error object
+({"error", "message", "statusCode"}) was printed. If the failure happened
+before the report started streaming (bad request, unsupported format) the
+error is the only thing on stdout. Otherwise stdout may hold a partial
+report, which must be discarded, and the error is printed to stderr.
 """
 
-import json
 import os
 import sys
-from io import BytesIO
+
+import orjson
 
 # Add current directory to path for imports
 sys.path.insert(0, os.path.dirname(__file__))
@@ -18,6 +25,7 @@ from templates.word_template import generate_word_report
 from templates.html_template import generate_html_report
 from templates.markdown_template import generate_markdown_report
 from templates.text_template import generate_text_report
+from templates.summary_template import generate_fallback_summary
 
 # Try to import AI summary, but make it optional
 try:
@@ -30,17 +38,23 @@ except ImportError:
 
 
 def main():
+    # Set once report bytes may have reached stdout; errors after that go to
+    # stderr so they can't be mistaken for (or appended to) the report
+    streaming = False
     try:
         # Read request from environment
         request_json = os.environ.get("REQUEST_BODY", "{}")
-        request_data = json.loads(request_json)
+        request_data = orjson.loads(request_json)
         
         # Parse and validate request
-        report_request = ReportRequest(**request_data)
+        report_request = ReportRequest.model_validate(request_data)
         
         # Generate executive summary if requested
         executive_summary = None
-        if report_request.include_ai_summary and AI_SUMMARY_AVAILABLE:
+        if report_request.include_ai_summary and report_request.audit_data.total_issues == 0:
+            # Nothing for the model to analyse; skip the provider round trip
+            executive_summary = generate_fallback_summary(report_request.audit_data, report_request.locale)
+        elif report_request.include_ai_summary and AI_SUMMARY_AVAILABLE:
             try:
                 executive_summary = generate_executive_summary(report_request.audit_data)
             except Exception as e:
@@ -49,38 +63,44 @@ def main():
         # Select template based on format
         format_type = report_request.format
         
+        # Every format is written straight to stdout as it is generated;
+        # Word saves its zip into stdout rather than an in-memory copy
+        streaming = format_type in ("word", "html", "markdown", "text")
         if format_type == "word":
-            blob = generate_word_report(
+            generate_word_report(
                 report_request.audit_data,
-                report_request.template,
                 executive_summary,
-                report_request.locale
+                report_request.locale,
+                report_request.template,
+                sink=sys.stdout.buffer
             )
         elif format_type == "html":
-            blob = generate_html_report(
+            generate_html_report(
                 report_request.audit_data,
                 executive_summary,
-                report_request.locale
+                report_request.locale,
+                writer=sys.stdout.buffer
             )
         elif format_type == "markdown":
-            blob = generate_markdown_report(
+            generate_markdown_report(
                 report_request.audit_data,
                 executive_summary,
-                report_request.locale
+                report_request.locale,
+                writer=sys.stdout.buffer
             )
         elif format_type == "text":
-            blob = generate_text_report(
+            generate_text_report(
                 report_request.audit_data,
                 executive_summary,
-                report_request.locale
+                report_request.locale,
+                writer=sys.stdout.buffer
             )
         else:
             error = {"error": "INVALID_FORMAT", "message": f"Unsupported format: {format_type}", "statusCode": 400}
-            print(json.dumps(error))
+            print(orjson.dumps(error).decode())
             sys.exit(1)
         
-        # Write binary data to stdout
-        sys.stdout.buffer.write(blob.getvalue())
+        sys.stdout.flush()
         sys.exit(0)
         
     except Exception as e:
@@ -89,7 +109,7 @@ def main():
             "message": str(e),
             "statusCode": 500
         }
-        print(json.dumps(error))
+        print(orjson.dumps(error).decode(), file=sys.stderr if streaming else sys.stdout)
         sys.exit(1)
 
 
@@ -8,11 +8,14 @@ from datetime import datetime
 from typing import Any, Dict, Optional
 from io import BytesIO
 
-from .models import AuditData, ReportRequest, ErrorResponse
+import orjson
+
+from .models import ReportRequest, ErrorResponse
 from .templates.word_template import generate_word_report
 from .templates.html_template import generate_html_report
 from .templates.markdown_template import generate_markdown_report
 from .templates.text_template import generate_text_report
+from .templates.summary_template import generate_fallback_summary
 
 # Try to import AI summary, but make it optional
 try:
@@ -57,7 +60,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         return {
             "statusCode": 405,
             "headers": headers,
-            "body": json.dumps({"error": "METHOD_NOT_ALLOWED", "message": "Only POST requests are accepted"}),
+            "body": orjson.dumps({"error": "METHOD_NOT_ALLOWED", "message": "Only POST requests are accepted"}).decode(),
         }
     
     # Verify authentication
@@ -68,40 +71,41 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         return {
             "statusCode": 500,
             "headers": headers,
-            "body": json.dumps({"error": "SERVER_CONFIG_ERROR", "message": "Report service not configured"}),
+            "body": orjson.dumps({"error": "SERVER_CONFIG_ERROR", "message": "Report service not configured"}).decode(),
         }
     
     if not api_key or api_key != expected_key:
         return {
             "statusCode": 401,
             "headers": headers,
-            "body": json.dumps({"error": "UNAUTHORIZED", "message": "Invalid or missing API key"}),
+            "body": orjson.dumps({"error": "UNAUTHORIZED", "message": "Invalid or missing API key"}).decode(),
         }
     
     try:
         # Parse request body
         body = event.get("body", "{}")
         if isinstance(body, str):
-            request_data = json.loads(body)
+            request_data = orjson.loads(body)
         else:
             request_data = body
         
         # Validate request
         try:
-            report_request = ReportRequest(**request_data)
+            report_request = ReportRequest.model_validate(request_data)
         except Exception as e:
             return {
                 "statusCode": 400,
                 "headers": headers,
-                "body": json.dumps({
+                "body": orjson.dumps({
                     "error": "INVALID_REQUEST",
                     "message": f"Request validation failed: {str(e)}"
-                }),
+                }).decode(),
             }
         
-        # Generate executive summary if requested
+        # Generate executive summary if requested. A clean audit has nothing
+        # for the model to analyse, so skip the provider round trip
         executive_summary = None
-        if report_request.include_ai_summary:
+        if report_request.include_ai_summary and report_request.audit_data.total_issues > 0:
             try:
                 executive_summary = generate_executive_summary(
                     report_request.audit_data,
@@ -110,7 +114,9 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             except Exception as e:
                 # Don't fail the entire request if AI summary fails
                 print(f"Warning: Failed to generate AI summary: {e}")
-                executive_summary = _generate_fallback_summary(report_request.audit_data, report_request.locale)
+                executive_summary = generate_fallback_summary(report_request.audit_data, report_request.locale)
+        elif report_request.include_ai_summary:
+            executive_summary = generate_fallback_summary(report_request.audit_data, report_request.locale)
         
         # Determine output format from template or query parameter
         format_type = report_request.format or _get_format_from_template(report_request.template)
@@ -152,18 +158,22 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             is_binary = False
             
         else:  # Default to Word document
-            report_buffer = generate_word_report(
+            report_buffer = BytesIO()
+            generate_word_report(
                 report_request.audit_data,
                 executive_summary,
                 report_request.locale,
-                report_request.template
+                report_request.template,
+                sink=report_buffer
             )
             content_type = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
             filename = f"accessibility-report-{report_request.audit_id}.docx"
             is_binary = True
-            # For binary content, Netlify expects base64
+            # For binary content, Netlify expects base64. Encode straight from
+            # the buffer's memory rather than a getvalue() copy; the base64
+            # alphabet is pure ASCII
             import base64
-            report_content = base64.b64encode(report_buffer.getvalue()).decode('utf-8')
+            report_content = base64.b64encode(report_buffer.getbuffer()).decode('ascii')
         
         generation_time = int((datetime.now() - start_time).total_seconds() * 1000)
         
@@ -183,27 +193,30 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             "isBase64Encoded": is_binary,
         }
         
-    except json.JSONDecodeError as e:
+    except (orjson.JSONDecodeError, json.JSONDecodeError) as e:
         return {
             "statusCode": 400,
             "headers": headers,
-            "body": json.dumps({
+            "body": orjson.dumps({
                 "error": "INVALID_JSON",
                 "message": f"Failed to parse request body: {str(e)}"
-            }),
+            }).decode(),
         }
     except Exception as e:
-        print(f"Error generating report: {e}")
-        import traceback
-        traceback.print_exc()
+        # Full tracebacks only on request: formatting one per failure is
+        # costly when an upstream outage fails every request
+        print(f"Error generating report: {e!r}")
+        if os.environ.get("ALLY_DEBUG"):
+            import traceback
+            traceback.print_exc()
         
         return {
             "statusCode": 500,
             "headers": headers,
-            "body": json.dumps({
+            "body": orjson.dumps({
                 "error": "GENERATION_ERROR",
                 "message": f"Failed to generate report: {str(e)}"
-            }),
+            }).decode(),
         }
 
 
@@ -219,28 +232,3 @@ def _get_format_from_template(template: str) -> str:
     }
     return template_format_map.get(template, "word")
 
-
-def _generate_fallback_summary(audit_data: AuditData, locale: str) -> str:
-    """Generate a simple template-based summary if AI fails."""
-    if locale == "sv-SE":
-        return f"""
-Denna rapport innehåller {audit_data.total_issues} tillgänglighetsproblem funna i granskningen.
-Problemen är kategoriserade enligt WCAG 2.2 AA:s fyra principer:
-- Möjlig att uppfatta: {audit_data.perceivable_count} problem
-- Hanterbar: {audit_data.operable_count} problem  
-- Begriplig: {audit_data.understandable_count} problem
-- Robust: {audit_data.robust_count} problem
-
-En detaljerad genomgång av varje problem med åtgärdsrekommendationer finns nedan.
-""".strip()
-    else:
-        return f"""
-This report contains {audit_data.total_issues} accessibility issues found during the audit.
-Issues are categorized by the four WCAG 2.2 AA principles:
-- Perceivable: {audit_data.perceivable_count} issues
-- Operable: {audit_data.operable_count} issues
-- Understandable: {audit_data.understandable_count} issues
-- Robust: {audit_data.robust_count} issues
-
-A detailed breakdown of each issue with remediation recommendations follows below.
-""".strip()
@@ -1,3 +1,20 @@
 """
 Templates for report generation.
 """
+
+from typing import BinaryIO, Optional
+
+
+def flush_lines(lines: list, writer: Optional[BinaryIO]) -> None:
+    """
+    Stream the lines buffered so far to writer and clear the buffer.
+    
+    The chunk ends with the newline that joins it to the next one, so the
+    concatenated output matches "\n".join() over all lines. Does nothing
+    when there is no writer (the report is returned as a string instead).
+    """
+    if writer is None or not lines:
+        return
+    writer.write(("\n".join(lines) + "\n").encode("utf-8"))
+    writer.flush()
+    lines.clear()
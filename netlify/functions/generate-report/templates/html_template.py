@@ -2,7 +2,7 @@
 HTML report template generation.
 """
 
-from typing import Optional
+from typing import BinaryIO, Optional
 from jinja2 import Template
 
 from ..models import AuditData
@@ -417,8 +417,9 @@ HTML_TEMPLATE = """<!DOCTYPE html>
 def generate_html_report(
     audit_data: AuditData,
     executive_summary: Optional[str],
-    locale: str = "sv-SE"
-) -> str:
+    locale: str = "sv-SE",
+    writer: Optional[BinaryIO] = None
+) -> Optional[str]:
     """
     Generate HTML accessibility report.
     
@@ -426,13 +427,22 @@ def generate_html_report(
         audit_data: Audit results data
         executive_summary: AI-generated summary (optional)
         locale: Language locale
+        writer: Binary stream to write the UTF-8 report to as it renders
+            (e.g. sys.stdout.buffer) instead of returning it
         
     Returns:
-        HTML string
+        HTML string, or None when written to writer
     """
     template = Template(HTML_TEMPLATE)
-    return template.render(
-        audit_data=audit_data,
-        executive_summary=executive_summary,
-        locale=locale
-    )
+    context = {
+        "audit_data": audit_data,
+        "executive_summary": executive_summary,
+        "locale": locale,
+    }
+    if writer is not None:
+        for chunk in template.generate(**context):
+            writer.write(chunk.encode("utf-8"))
+        writer.flush()
+        return None
+    
+    return template.render(**context)
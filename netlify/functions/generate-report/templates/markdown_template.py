@@ -2,16 +2,18 @@
 Markdown report template generation.
 """
 
-from typing import Optional
+from typing import BinaryIO, Optional
 
 from ..models import AuditData
+from . import flush_lines
 
 
 def generate_markdown_report(
     audit_data: AuditData,
     executive_summary: Optional[str],
-    locale: str = "sv-SE"
-) -> str:
+    locale: str = "sv-SE",
+    writer: Optional[BinaryIO] = None
+) -> Optional[str]:
     """
     Generate Markdown accessibility report.
     
@@ -19,9 +21,11 @@ def generate_markdown_report(
         audit_data: Audit results data
         executive_summary: AI-generated summary (optional)
         locale: Language locale
+        writer: Binary stream to write the UTF-8 report to section by
+            section (e.g. sys.stdout.buffer) instead of returning it
         
     Returns:
-        Markdown string
+        Markdown string, or None when written to writer
     """
     lines = []
     
@@ -42,6 +46,8 @@ def generate_markdown_report(
     lines.append(f"- **{'Totalt antal problem' if locale == 'sv-SE' else 'Total Issues'}:** {audit_data.total_issues}")
     lines.append("")
     
+    flush_lines(lines, writer)
+    
     # Executive Summary
     if executive_summary:
         lines.append(f"## {'Sammanfattning' if locale == 'sv-SE' else 'Executive Summary'}")
@@ -49,6 +55,8 @@ def generate_markdown_report(
         lines.append(executive_summary)
         lines.append("")
     
+    flush_lines(lines, writer)
+    
     # Overview
     lines.append(f"## {'Översikt' if locale == 'sv-SE' else 'Overview'}")
     lines.append("")
@@ -80,6 +88,8 @@ def generate_markdown_report(
     lines.append(f"- **{principle_names[locale]['Robust']}:** {audit_data.robust_count} {'problem' if locale == 'sv-SE' else 'issues'}")
     lines.append("")
     
+    flush_lines(lines, writer)
+    
     # Issues by Principle
     lines.append(f"## {'Problem efter princip' if locale == 'sv-SE' else 'Issues by Principle'}")
     lines.append("")
@@ -91,6 +101,7 @@ def generate_markdown_report(
         if not principle_issues:
             continue
         
+        flush_lines(lines, writer)
         lines.append(f"### {principle_names[locale][principle]} ({len(principle_issues)})")
         lines.append("")
         
@@ -140,6 +151,8 @@ def generate_markdown_report(
             lines.append("---")
             lines.append("")
     
+    flush_lines(lines, writer)
+    
     # Compliance Scorecard
     lines.append(f"## {'Efterlevnadssammanfattning' if locale == 'sv-SE' else 'Compliance Scorecard'}")
     lines.append("")
@@ -180,4 +193,9 @@ def generate_markdown_report(
     lines.append(f"*{'Detta dokument genererades automatiskt av ETU Tillgänglighetskontroll.' if locale == 'sv-SE' else 'This document was automatically generated by ETU Accessibility Checker.'}*")
     lines.append(f"*{audit_data.created_at.strftime('%Y-%m-%d %H:%M:%S')}*")
     
+    if writer is not None:
+        writer.write("\n".join(lines).encode("utf-8"))
+        writer.flush()
+        return None
+    
     return "\n".join(lines)
@@ -0,0 +1,31 @@
+"""
+Template-based executive summary, used instead of an AI summary.
+"""
+
+from ..models import AuditData
+
+
+def generate_fallback_summary(audit_data: AuditData, locale: str) -> str:
+    """Generate a simple template-based summary (no issues to analyse, or AI failed)."""
+    if locale == "sv-SE":
+        return f"""
+Denna rapport innehåller {audit_data.total_issues} tillgänglighetsproblem funna i granskningen.
+Problemen är kategoriserade enligt WCAG 2.2 AA:s fyra principer:
+- Möjlig att uppfatta: {audit_data.perceivable_count} problem
+- Hanterbar: {audit_data.operable_count} problem  
+- Begriplig: {audit_data.understandable_count} problem
+- Robust: {audit_data.robust_count} problem
+
+En detaljerad genomgång av varje problem med åtgärdsrekommendationer finns nedan.
+""".strip()
+    else:
+        return f"""
+This report contains {audit_data.total_issues} accessibility issues found during the audit.
+Issues are categorized by the four WCAG 2.2 AA principles:
+- Perceivable: {audit_data.perceivable_count} issues
+- Operable: {audit_data.operable_count} issues
+- Understandable: {audit_data.understandable_count} issues
+- Robust: {audit_data.robust_count} issues
+
+A detailed breakdown of each issue with remediation recommendations follows below.
+""".strip()
@@ -2,16 +2,18 @@
 Plain text report template generation (screen reader optimized).
 """
 
-from typing import Optional
+from typing import BinaryIO, Optional
 
 from ..models import AuditData
+from . import flush_lines
 
 
 def generate_text_report(
     audit_data: AuditData,
     executive_summary: Optional[str],
-    locale: str = "sv-SE"
-) -> str:
+    locale: str = "sv-SE",
+    writer: Optional[BinaryIO] = None
+) -> Optional[str]:
     """
     Generate plain text accessibility report optimized for screen readers.
     
@@ -19,9 +21,11 @@ def generate_text_report(
         audit_data: Audit results data
         executive_summary: AI-generated summary (optional)
         locale: Language locale
+        writer: Binary stream to write the UTF-8 report to section by
+            section (e.g. sys.stdout.buffer) instead of returning it
         
     Returns:
-        Plain text string
+        Plain text string, or None when written to writer
     """
     lines = []
     separator = "=" * 80
@@ -46,6 +50,8 @@ def generate_text_report(
     lines.append("")
     lines.append("")
     
+    flush_lines(lines, writer)
+    
     # Executive Summary
     if executive_summary:
         lines.append("SAMMANFATTNING" if locale == "sv-SE" else "EXECUTIVE SUMMARY")
@@ -57,6 +63,8 @@ def generate_text_report(
         lines.append("")
         lines.append("")
     
+    flush_lines(lines, writer)
+    
     # Overview
     lines.append("ÖVERSIKT" if locale == "sv-SE" else "OVERVIEW")
     lines.append(subseparator)
@@ -92,6 +100,8 @@ def generate_text_report(
     lines.append("")
     lines.append("")
     
+    flush_lines(lines, writer)
+    
     # Issues by Principle
     lines.append("PROBLEM EFTER PRINCIP" if locale == "sv-SE" else "ISSUES BY PRINCIPLE")
     lines.append(subseparator)
@@ -105,6 +115,7 @@ def generate_text_report(
         if not principle_issues:
             continue
         
+        flush_lines(lines, writer)
         lines.append("")
         lines.append(f"{principle_names[locale][principle].upper()} ({len(principle_issues)} {'PROBLEM' if locale == 'sv-SE' else 'ISSUES'})")
         lines.append("")
@@ -150,6 +161,8 @@ def generate_text_report(
             lines.append("")
             issue_number += 1
     
+    flush_lines(lines, writer)
+    
     # Compliance Scorecard
     lines.append("")
     lines.append("EFTERLEVNADSSAMMANFATTNING" if locale == "sv-SE" else "COMPLIANCE SCORECARD")
@@ -202,6 +215,11 @@ def generate_text_report(
     lines.append(audit_data.created_at.strftime('%Y-%m-%d %H:%M:%S').center(80))
     lines.append(separator)
     
+    if writer is not None:
+        writer.write("\n".join(lines).encode("utf-8"))
+        writer.flush()
+        return None
+    
     return "\n".join(lines)
 
 
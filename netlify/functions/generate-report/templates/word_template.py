@@ -4,7 +4,7 @@ Word document (ETU format) report generation using python-docx.
 
 from datetime import datetime
 from io import BytesIO
-from typing import Optional
+from typing import BinaryIO, Optional
 
 from docx import Document
 from docx.shared import Pt, RGBColor, Inches
@@ -18,8 +18,9 @@ def generate_word_report(
     audit_data: AuditData,
     executive_summary: Optional[str],
     locale: str = "sv-SE",
-    template: str = "etu-standard"
-) -> BytesIO:
+    template: str = "etu-standard",
+    sink: Optional[BinaryIO] = None
+) -> BinaryIO:
     """
     Generate ETU-formatted Word accessibility report.
     
@@ -28,9 +29,11 @@ def generate_word_report(
         executive_summary: AI-generated summary (optional)
         locale: Language locale
         template: Template type (etu-standard, etu-detailed, etu-summary)
+        sink: Binary stream to save the document into, e.g. a caller's
+            buffer or sys.stdout.buffer (a new BytesIO if omitted)
         
     Returns:
-        BytesIO buffer containing the Word document
+        The sink containing the Word document (rewound if it is a BytesIO)
     """
     # Create document
     doc = Document()
@@ -53,12 +56,14 @@ def generate_word_report(
     _add_issues_by_principle(doc, audit_data, locale, template)
     _add_compliance_scorecard(doc, audit_data, locale)
     
-    # Save to buffer
-    buffer = BytesIO()
-    doc.save(buffer)
-    buffer.seek(0)
+    # Save straight into the caller's sink so the document exists only once
+    if sink is None:
+        sink = BytesIO()
+    doc.save(sink)
+    if isinstance(sink, BytesIO):
+        sink.seek(0)
     
-    return buffer
+    return sink
 
 
 def _setup_styles(doc: Document):
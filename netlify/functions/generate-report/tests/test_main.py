@@ -211,3 +211,26 @@ def test_handler_swedish_locale(sample_event):
     
     assert response["statusCode"] == 200
     assert "Tillgänglighetsrapport" in response["body"]
+
+
+def test_handler_clean_audit_skips_ai_summary(sample_event, monkeypatch):
+    """Test a zero-issue audit gets the template summary without calling the AI."""
+    from .. import main
+    
+    def fail(*args, **kwargs):
+        raise AssertionError("AI summary should not be generated for a clean audit")
+    
+    monkeypatch.setattr(main, "generate_executive_summary", fail)
+    
+    body_data = json.loads(sample_event["body"])
+    body_data["include_ai_summary"] = True
+    body_data["audit_data"].update(
+        total_issues=0, perceivable_count=0, operable_count=0, issues=[]
+    )
+    sample_event["body"] = json.dumps(body_data)
+    sample_event["queryStringParameters"] = {"format": "text"}
+    
+    response = handler(sample_event, {})
+    
+    assert response["statusCode"] == 200
+    assert "This report contains 0 accessibility issues" in response["body"]
@@ -211,3 +211,22 @@ def test_principle_grouping(sample_audit_data):
     assert "OPERABLE (1 ISSUES)" in text
     assert "UNDERSTANDABLE (1 ISSUES)" in text
     assert "ROBUST (1 ISSUES)" in text
+
+
+@pytest.mark.parametrize("generate", [generate_html_report, generate_markdown_report, generate_text_report])
+def test_text_reports_stream_to_writer(sample_audit_data, generate):
+    """Test streaming a report to a writer produces the same bytes as the returned string."""
+    writer = BytesIO()
+    result = generate(
+        audit_data=sample_audit_data,
+        executive_summary="This is a test summary.",
+        locale="en-US",
+        writer=writer
+    )
+    
+    assert result is None
+    assert writer.getvalue() == generate(
+        audit_data=sample_audit_data,
+        executive_summary="This is a test summary.",
+        locale="en-US"
+    ).encode("utf-8")
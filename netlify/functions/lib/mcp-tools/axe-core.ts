@@ -91,12 +91,15 @@ export async function handleAxeTool(name: string, args: any): Promise<any> {
       console.log('[Axe] axe-core injected, type:', typeof window.axe);
       
       // Configure axe for this window
+      // Only violations need node details; passes/incomplete are reported as
+      // counts, and axe still lists every rule for types outside resultTypes
+      // (with a single node each), so their lengths stay accurate.
       const axeConfig = {
         runOnly: {
           type: 'tag',
           values: rules
         },
-        resultTypes: ['violations', 'passes', 'incomplete'],
+        resultTypes: ['violations'],
       };
       
       console.log('[Axe] Running axe-core analysis...');
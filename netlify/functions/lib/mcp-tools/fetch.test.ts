@@ -0,0 +1,85 @@
+// @vitest-environment node
+import { describe, it, expect, vi, afterEach } from 'vitest';
+import { handleFetchTool } from './fetch';
+
+function mockResponse(body: string | null, init: ResponseInit, url: string): Response {
+  const response = new Response(body, init);
+  Object.defineProperty(response, 'url', { value: url });
+  return response;
+}
+
+describe('handleFetchTool', () => {
+  afterEach(() => {
+    vi.unstubAllGlobals();
+  });
+
+  it('returns the page body with the response status for fetch_url', async () => {
+    const url = 'https://example.com/page';
+    const fetchMock = vi.fn(async () =>
+      mockResponse('<html><title>Page</title></html>', {
+        status: 200,
+        statusText: 'OK',
+        headers: { 'content-type': 'text/html' },
+      }, url)
+    );
+    vi.stubGlobal('fetch', fetchMock);
+
+    const result = await handleFetchTool('fetch_url', { url });
+
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+    expect(result).toEqual({
+      content: '<html><title>Page</title></html>',
+      url,
+      status: 200,
+      statusText: 'OK',
+      contentType: 'text/html',
+      size: 32,
+      truncated: false,
+      cache: 'miss',
+    });
+  });
+
+  it('serves a cached body when fetch_url gets a 304', async () => {
+    const url = 'https://example.com/cached';
+    const fetchMock = vi.fn()
+      .mockResolvedValueOnce(mockResponse('<html>v1</html>', {
+        status: 200,
+        statusText: 'OK',
+        headers: { 'content-type': 'text/html', etag: '"v1"' },
+      }, url))
+      .mockResolvedValueOnce(mockResponse(null, { status: 304, statusText: 'Not Modified' }, url));
+    vi.stubGlobal('fetch', fetchMock);
+
+    await handleFetchTool('fetch_url', { url });
+    const result = await handleFetchTool('fetch_url', { url });
+
+    expect(fetchMock.mock.calls[1][1].headers['If-None-Match']).toBe('"v1"');
+    expect(result.content).toBe('<html>v1</html>');
+    expect(result.status).toBe(304);
+    expect(result.cache).toBe('hit');
+  });
+
+  it('reports 200 when fetch_url_metadata falls back to a ranged GET', async () => {
+    const url = 'https://example.com/no-head';
+    const fetchMock = vi.fn()
+      .mockResolvedValueOnce(mockResponse(null, { status: 405, statusText: 'Method Not Allowed' }, url))
+      .mockResolvedValueOnce(mockResponse('<', {
+        status: 206,
+        statusText: 'Partial Content',
+        headers: { 'content-type': 'text/html' },
+      }, url))
+      .mockResolvedValueOnce(mockResponse('<html><head><title>No HEAD</title></head></html>', {
+        status: 200,
+        statusText: 'OK',
+        headers: { 'content-type': 'text/html' },
+      }, url));
+    vi.stubGlobal('fetch', fetchMock);
+
+    const result = await handleFetchTool('fetch_url_metadata', { url });
+
+    expect(fetchMock.mock.calls[1][1].headers.Range).toBe('bytes=0-0');
+    expect(result.status).toBe(200);
+    expect(result.statusText).toBe('OK');
+    expect(result.title).toBe('No HEAD');
+  });
+});
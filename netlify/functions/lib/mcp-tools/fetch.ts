@@ -23,6 +23,10 @@ export const fetchTools: Tool[] = [
         follow_redirects: {
           type: "boolean",
           description: "Whether to follow redirects (default: true)",
+        },
+        max_bytes: {
+          type: "number",
+          description: "Maximum body size to read in bytes; larger pages are truncated (default: 5242880)",
         }
       },
       required: ["url"]
@@ -44,33 +48,132 @@ export const fetchTools: Tool[] = [
   }
 ];
 
+/**
+ * Bodies of previously fetched URLs, revalidated with conditional GETs so
+ * re-scans of an unchanged page skip the body download. A Map keeps
+ * insertion order, so re-inserting on use makes the first key the least
+ * recently used one.
+ */
+interface CachedBody {
+  etag: string | null;
+  lastModified: string | null;
+  url: string;
+  contentType: string;
+  content: string;
+}
+
+const BODY_CACHE_MAX_ENTRIES = 256;
+const bodyCache = new Map<string, CachedBody>();
+
+function rememberBody(key: string, entry: CachedBody): void {
+  bodyCache.delete(key);
+  bodyCache.set(key, entry);
+  if (bodyCache.size > BODY_CACHE_MAX_ENTRIES) {
+    const oldest = bodyCache.keys().next().value;
+    if (oldest !== undefined) {
+      bodyCache.delete(oldest);
+    }
+  }
+}
+
+const DEFAULT_MAX_BYTES = 5 * 1024 * 1024;
+// <title> and the description meta tag live in <head>, so metadata lookups
+// only need the start of the document
+const METADATA_MAX_BYTES = 64 * 1024;
+
+/**
+ * Read a response body incrementally, stopping once maxBytes have arrived
+ * so oversized pages never get buffered in full.
+ */
+async function readCappedText(response: Response, maxBytes: number): Promise<{ text: string; truncated: boolean }> {
+  if (!response.body) {
+    return { text: '', truncated: false };
+  }
+  
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  const parts: string[] = [];
+  let received = 0;
+  let truncated = false;
+  
+  while (true) {
+    const { done, value } = await reader.read();
+    if (done) {
+      break;
+    }
+    const remaining = maxBytes - received;
+    if (value.byteLength > remaining) {
+      parts.push(decoder.decode(value.subarray(0, remaining)));
+      truncated = true;
+      await reader.cancel();
+      break;
+    }
+    received += value.byteLength;
+    parts.push(decoder.decode(value, { stream: true }));
+  }
+  parts.push(decoder.decode());
+  
+  return { text: parts.join(''), truncated };
+}
+
 export async function handleFetchTool(name: string, args: any): Promise<any> {
   if (name === "fetch_url") {
     const url = args.url;
     const timeout = args.timeout || 30;
     const followRedirects = args.follow_redirects !== false;
+    const maxBytes = args.max_bytes || DEFAULT_MAX_BYTES;
     
     try {
       const controller = new AbortController();
       const timeoutId = setTimeout(() => controller.abort(), timeout * 1000);
       
+      const cacheKey = `${followRedirects ? 'follow' : 'manual'} ${url}`;
+      const cached = bodyCache.get(cacheKey);
+      const headers: Record<string, string> = {
+        'User-Agent': 'A11yChecker/1.0 (Accessibility Audit Bot)',
+      };
+      if (cached?.etag) {
+        headers['If-None-Match'] = cached.etag;
+      }
+      if (cached?.lastModified) {
+        headers['If-Modified-Since'] = cached.lastModified;
+      }
+      
       const response = await fetch(url, {
         redirect: followRedirects ? 'follow' : 'manual',
         signal: controller.signal,
-        headers: {
-          'User-Agent': 'A11yChecker/1.0 (Accessibility Audit Bot)',
-        }
+        headers,
       });
       
       clearTimeout(timeoutId);
       
+      if (response.status === 304 && cached) {
+        rememberBody(cacheKey, cached);
+        return {
+          content: cached.content,
+          url: cached.url,
+          status: response.status,
+          statusText: response.statusText,
+          contentType: cached.contentType,
+          size: cached.content.length,
+          cache: 'hit',
+        };
+      }
+      
       if (!response.ok) {
         throw new Error(`HTTP ${response.status}: ${response.statusText}`);
       }
       
-      const html = await response.text();
+      const { text, truncated } = await readCappedText(response, maxBytes);
+      const html = truncated ? `${text}\n[truncated]` : text;
       const contentType = response.headers.get('content-type') || '';
       
+      const etag = response.headers.get('etag');
+      const lastModified = response.headers.get('last-modified');
+      if (!truncated && (etag || lastModified)) {
+        rememberBody(cacheKey, { etag, lastModified, url: response.url, contentType, content: html });
+      }
+      
       return {
         content: html,
         url: response.url, // Final URL after redirects
@@ -78,6 +181,8 @@ export async function handleFetchTool(name: string, args: any): Promise<any> {
         statusText: response.statusText,
         contentType,
         size: html.length,
+        truncated,
+        cache: 'miss',
       };
     } catch (error) {
       if (error instanceof Error && error.name === 'AbortError') {
@@ -94,7 +199,7 @@ export async function handleFetchTool(name: string, args: any): Promise<any> {
       const controller = new AbortController();
       const timeoutId = setTimeout(() => controller.abort(), 10000);
       
-      const response = await fetch(url, {
+      let response = await fetch(url, {
         method: 'HEAD',
         signal: controller.signal,
         headers: {
@@ -102,9 +207,27 @@ export async function handleFetchTool(name: string, args: any): Promise<any> {
         }
       });
       
+      let status = response.status;
+      let statusText = response.statusText;
+      
+      // Some origins reject HEAD; a one-byte ranged GET returns the same headers
+      if (response.status === 405 || response.status === 501) {
+        response = await fetch(url, {
+          signal: controller.signal,
+          headers: {
+            'User-Agent': 'A11yChecker/1.0 (Accessibility Audit Bot)',
+            'Range': 'bytes=0-0',
+          }
+        });
+        await response.body?.cancel();
+        
+        // 206 only reflects our Range header; callers expect the page's status
+        status = response.status === 206 ? 200 : response.status;
+        statusText = response.status === 206 ? 'OK' : response.statusText;
+      }
+      
       clearTimeout(timeoutId);
       
-      // If HEAD doesn't work, try GET with early abort
       let title = '';
       let description = '';
       
@@ -116,7 +239,7 @@ export async function handleFetchTool(name: string, args: any): Promise<any> {
           }
         });
         
-        const html = await getResponse.text();
+        const { text: html } = await readCappedText(getResponse, METADATA_MAX_BYTES);
         
         // Extract title
         const titleMatch = html.match(/<title[^>]*>([^<]+)<\/title>/i);
@@ -129,8 +252,8 @@ export async function handleFetchTool(name: string, args: any): Promise<any> {
       
       return {
         url: response.url,
-        status: response.status,
-        statusText: response.statusText,
+        status,
+        statusText,
         contentType: response.headers.get('content-type') || '',
         title,
         description,
@@ -45,7 +45,7 @@ export async function executeTool(toolName: string, args: any): Promise<any> {
   }
   
   if (toolName.startsWith("get_wcag_") || toolName.startsWith("search_wcag_") || toolName === "get_all_criteria") {
-    return await handleWcagTool(toolName, args);
+    return handleWcagTool(toolName, args);
   }
   
   if (toolName.startsWith("get_wai_") || toolName.startsWith("search_wai_") || toolName.startsWith("get_aria_")) {
@@ -178,7 +178,53 @@ const wcagData: Record<string, WCAGCriterion> = {
   }
 };
 
-export async function handleWcagTool(name: string, args: any): Promise<any> {
+type CriterionEntry = [string, WCAGCriterion];
+
+// Criteria grouped by principle and by level once at module load, so the
+// search tools slice a prebuilt list instead of filtering every entry
+const allCriteria: CriterionEntry[] = Object.entries(wcagData);
+const criteriaByPrinciple = new Map<string, CriterionEntry[]>();
+const criteriaByLevel = new Map<string, CriterionEntry[]>();
+
+for (const entry of allCriteria) {
+  const [, criterion] = entry;
+  if (!criteriaByPrinciple.has(criterion.principle)) {
+    criteriaByPrinciple.set(criterion.principle, []);
+  }
+  criteriaByPrinciple.get(criterion.principle)!.push(entry);
+  if (!criteriaByLevel.has(criterion.level)) {
+    criteriaByLevel.set(criterion.level, []);
+  }
+  criteriaByLevel.get(criterion.level)!.push(entry);
+}
+
+/**
+ * Format a criterion with its examples and resource links
+ */
+function renderCriterion(data: WCAGCriterion): string {
+  let result = `WCAG ${data.num}: ${data.title} (Level ${data.level})\n\n`;
+  result += `Principle: ${data.principle}\n`;
+  result += `Guideline: ${data.guideline}\n\n`;
+  result += `Description:\n${data.description}\n\n`;
+  
+  if (data.examples && data.examples.length > 0) {
+    result += `Examples:\n${data.examples.map(ex => `- ${ex}`).join('\n')}\n\n`;
+  }
+  
+  result += `Resources:\n`;
+  result += `- Understanding: ${data.understanding_url}\n`;
+  result += `- How to Meet: ${data.how_to_meet_url}\n`;
+  result += `- EN 301 549: ${data.en_301_549}\n`;
+  
+  return result;
+}
+
+// The criteria are static, so each one is rendered once at module load
+const renderedCriteria = new Map<string, string>(
+  allCriteria.map(([id, criterion]) => [id, renderCriterion(criterion)])
+);
+
+export function handleWcagTool(name: string, args: any): any {
   if (name === "get_wcag_criterion") {
     const criterion_id = args.criterion_id || args.criterion;
     
@@ -205,30 +251,16 @@ export async function handleWcagTool(name: string, args: any): Promise<any> {
       };
     }
     
-    // Format criterion with examples
-    let result = `WCAG ${data.num}: ${data.title} (Level ${data.level})\n\n`;
-    result += `Principle: ${data.principle}\n`;
-    result += `Guideline: ${data.guideline}\n\n`;
-    result += `Description:\n${data.description}\n\n`;
-    
-    if (data.examples && data.examples.length > 0) {
-      result += `Examples:\n${data.examples.map(ex => `- ${ex}`).join('\n')}\n\n`;
-    }
-    
-    result += `Resources:\n`;
-    result += `- Understanding: ${data.understanding_url}\n`;
-    result += `- How to Meet: ${data.how_to_meet_url}\n`;
-    result += `- EN 301 549: ${data.en_301_549}\n`;
-    
-    return { text: result, data };
+    return { text: renderedCriteria.get(criterion_id)!, data };
   }
   
   if (name === "search_wcag_by_principle") {
     const { principle, level } = args;
     
-    const matches = Object.entries(wcagData).filter(([_, criterion]) => {
-      return criterion.principle === principle && (!level || criterion.level === level);
-    });
+    const byPrinciple = criteriaByPrinciple.get(principle) ?? [];
+    const matches = level
+      ? byPrinciple.filter(([_, criterion]) => criterion.level === level)
+      : byPrinciple;
     
     if (matches.length === 0) {
       return {
@@ -261,9 +293,7 @@ export async function handleWcagTool(name: string, args: any): Promise<any> {
   if (name === "get_all_criteria") {
     const { level } = args;
     
-    const criteria = Object.entries(wcagData).filter(([_, criterion]) => {
-      return !level || criterion.level === level;
-    });
+    const criteria = level ? criteriaByLevel.get(level) ?? [] : allCriteria;
     
     let result = `WCAG 2.2 Success Criteria${level ? ` (Level ${level})` : ''}:\n\n`;
     criteria.forEach(([id, criterion]) => {